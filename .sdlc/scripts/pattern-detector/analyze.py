@@ -18,7 +18,7 @@ Input:
 Output:
     JSON file with structure:
     {
-        "timestamp": "ISO-8601 datetime",
+        "timestamp": "ISO-8601 UTC datetime",
         "patterns": [
             {
                 "name": "Pattern name",
@@ -34,15 +34,44 @@ Output:
 """
 
 import argparse
+import asyncio
+import hashlib
+import importlib.util
 import json
 import os
+import random
+import re
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from datetime import datetime
+import traceback
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
+_UTC = timezone.utc
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize to JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 # Analysis prompt template
 ANALYSIS_PROMPT = """You are a software engineering expert analyzing code development patterns. You have been given signals from:
@@ -88,6 +117,35 @@ Return ONLY valid JSON with this structure (no markdown, no commentary):
 Identify up to 10 patterns, ranked by (impact × frequency).
 """
 
+# Static instructions preceding the signals. They are identical on every call,
+# so the SDK path sends them as a separate block marked for prompt caching.
+# Prompts are built by concatenation, so the suffix's {{ }} escapes are undone
+# here once instead of running str.format over the template on every call.
+ANALYSIS_PROMPT_PREFIX, _ANALYSIS_PROMPT_SUFFIX = ANALYSIS_PROMPT.split('{signals}', 1)
+_ANALYSIS_PROMPT_SUFFIX = _ANALYSIS_PROMPT_SUFFIX.replace('{{', '{').replace('}}', '}')
+
+ANALYSIS_MODEL = "claude-sonnet-4-5-20250929"
+
+# Output budget for the optional cheap triage pass
+TRIAGE_MAX_TOKENS = 2000
+
+# Numeric weights for pattern ranking (score = impact × frequency)
+IMPACT_SCORES = {
+    'high': 3.0,
+    'medium': 2.0,
+    'low': 1.0
+}
+
+FREQUENCY_SCORES = {
+    'daily': 4.0,
+    'weekly': 3.0,
+    'per-feature': 2.0,
+    'monthly': 1.0
+}
+
+# Signal lists from collect.py, drained round-robin when packing the prompt
+SIGNAL_CATEGORIES = ('git_signals', 'memory_signals', 'churn_signals')
+
 # Mock patterns for testing without API calls
 MOCK_PATTERNS = {
     "patterns": [
@@ -130,40 +188,237 @@ MOCK_PATTERNS = {
 }
 
 
+class _TransientCLIError(Exception):
+    """Claude CLI failure that may succeed if retried (timeout, rate limit or overload)."""
+
+
+# The CLI exits 1 for every API error, so transient ones are recognized by
+# their message: rate limits, overloads (529) and other 5xx server errors
+_TRANSIENT_CLI_STDERR_RE = re.compile(
+    r'rate[ _-]?limit|too many requests|overloaded|\b429\b|\b5\d\d\b'
+    r'|internal server error|bad gateway|service unavailable|gateway timeout',
+    re.IGNORECASE
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a failed Claude call can succeed on a later attempt.
+
+    SDK errors are checked against the anthropic module only if it has been
+    imported; an SDK error cannot exist before then, and checking never
+    imports the SDK.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        True for timeouts, connection errors, rate limits and server errors
+    """
+    if isinstance(error, _TransientCLIError):
+        return True
+    anthropic = sys.modules.get('anthropic')
+    return anthropic is not None and isinstance(error, (
+        anthropic.APIConnectionError,  # includes APITimeoutError
+        anthropic.RateLimitError,
+        anthropic.InternalServerError,
+        getattr(anthropic, 'OverloadedError', anthropic.InternalServerError),  # 529
+    ))
+
+
+class _RateLimiter:
+    """Token-bucket throttle for per-minute request and token quotas."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Request quota (None for unlimited)
+            tokens_per_minute: Input token quota (None for unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_budget = float(requests_per_minute or 0)
+        self._token_budget = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Credit both buckets for the time elapsed since the last update."""
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._request_budget = min(
+                self.requests_per_minute,
+                self._request_budget + elapsed * self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute:
+            self._token_budget = min(
+                self.tokens_per_minute,
+                self._token_budget + elapsed * self.tokens_per_minute / 60
+            )
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a request of the given size fits in both buckets."""
+        wait = max(0.0, self._blocked_until - now)
+        if self.requests_per_minute and self._request_budget < 1:
+            wait = max(wait, (1 - self._request_budget) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute and self._token_budget < tokens:
+            wait = max(wait, (tokens - self._token_budget) * 60 / self.tokens_per_minute)
+        return wait
+
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Block until a request of the given size is within quota, then reserve it.
+
+        Args:
+            estimated_tokens: Approximate input tokens the request will consume
+        """
+        if self.tokens_per_minute:
+            # A request larger than the whole quota can only wait for a full bucket
+            estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(estimated_tokens, now)
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self._request_budget -= 1
+                    if self.tokens_per_minute:
+                        self._token_budget -= estimated_tokens
+                    return
+            time.sleep(wait)
+
+    def penalty(self, seconds: float):
+        """
+        Block all callers for a server-requested cool-down period.
+
+        Args:
+            seconds: How long the API asked us to wait
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
 class PatternAnalyzer:
     """Analyzes collected signals using Claude API or CLI to identify patterns."""
 
-    def __init__(self, api_key: Optional[str] = None, use_cli: bool = True, mock: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_cli: Optional[bool] = None,
+        mock: bool = False,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_prompt_tokens: int = 6000,
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = 7 * 24 * 3600,
+        analysis_model: str = ANALYSIS_MODEL,
+        triage_model: Optional[str] = None,
+        min_patterns: int = 3
+    ):
         """
         Initialize pattern analyzer.
 
         Args:
             api_key: Anthropic API key (optional if using CLI or environment variable)
-            use_cli: Use Claude CLI instead of Python SDK (default: True)
+            use_cli: Use Claude CLI instead of Python SDK (default: auto - SDK when
+                the anthropic package and an API key are available, CLI otherwise)
             mock: Use mock data instead of real API calls (default: False)
+            requests_per_minute: Throttle API requests to this quota (default: unlimited)
+            tokens_per_minute: Throttle input tokens to this quota (default: unlimited)
+            max_prompt_tokens: Approximate prompt size to fill with signals (default: 6000)
+            use_cache: Reuse patterns cached for identical prompts (default: True)
+            cache_ttl: Seconds before a cached result expires, None to never expire
+                (default: 7 days)
+            analysis_model: Model for the full analysis (default: ANALYSIS_MODEL)
+            triage_model: Cheaper model for a first pass; the analysis model only
+                runs on promising results (default: None, no triage)
+            min_patterns: Triage pattern count that triggers full analysis (default: 3)
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        if use_cli is None:
+            # Prefer the SDK's pooled HTTP connection over spawning a CLI process per call
+            # find_spec only locates the SDK; importing it is left to the first SDK call
+            use_cli = importlib.util.find_spec('anthropic') is None or not self.api_key
         self.use_cli = use_cli
         self.mock = mock
         self.max_retries = 3
         self.retry_delay = 2  # seconds
+        self.max_prompt_tokens = max_prompt_tokens
+        self.use_cache = use_cache
+        self.analysis_model = analysis_model
+        self.triage_model = triage_model
+        self.min_patterns = min_patterns
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(
+            os.environ.get('PATTERN_CACHE_DIR', '~/.cache/pattern-detector')
+        ).expanduser()
+        self._limiter = _RateLimiter(requests_per_minute, tokens_per_minute)
+        self._sdk_client = None
+        self._sdk_lock = threading.Lock()
+
+    @property
+    def _sdk(self):
+        """
+        Anthropic client, created on first use and reused across calls.
+
+        Reusing the client keeps its HTTP connection pool warm, so retries and
+        repeated analyses skip the TCP/TLS handshake. analyze_async runs
+        analyses on worker threads, so creation is locked to build one client.
+
+        Raises:
+            ImportError: If anthropic SDK is not installed
+            ValueError: If no API key is available
+        """
+        with self._sdk_lock:
+            if self._sdk_client is None:
+                # Imported here so mock/CLI runs and --help never load the SDK
+                try:
+                    import anthropic
+                except ImportError:
+                    raise ImportError(
+                        "anthropic SDK not installed. Install with: pip install anthropic\n"
+                        "Or use --use-cli flag to use the Claude CLI instead."
+                    )
 
-    def _call_claude_cli(self, prompt: str) -> str:
+                if not self.api_key:
+                    raise ValueError(
+                        "ANTHROPIC_API_KEY environment variable not set and no API key provided"
+                    )
+
+                # Our own retry loop controls backoff, so disable SDK-level retries
+                self._sdk_client = anthropic.Anthropic(api_key=self.api_key, max_retries=0)
+
+        return self._sdk_client
+
+    def _call_claude_cli(self, prompt: str, model: str) -> str:
         """
         Call Claude using the CLI.
 
         Args:
             prompt: Analysis prompt
+            model: Model to run the prompt on
 
         Returns:
             Claude's response
 
         Raises:
-            subprocess.CalledProcessError: If CLI call fails
+            _TransientCLIError: If the CLI timed out, or its error names a rate
+                limit, overload or server error
+            Exception: If the CLI call fails for any other reason
         """
         try:
             result = subprocess.run(
-                ['claude', '-p', prompt],
+                ['claude', '-p', '--model', model, prompt],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -171,16 +426,47 @@ class PatternAnalyzer:
             )
             return result.stdout.strip()
         except subprocess.TimeoutExpired:
-            raise Exception("Claude CLI call timed out after 120 seconds")
+            raise _TransientCLIError("Claude CLI call timed out after 120 seconds")
         except subprocess.CalledProcessError as e:
+            if _TRANSIENT_CLI_STDERR_RE.search(e.stderr or ''):
+                raise _TransientCLIError(f"Claude CLI call failed: {e.stderr}")
             raise Exception(f"Claude CLI call failed: {e.stderr}")
 
-    def _call_claude_sdk(self, prompt: str) -> str:
+    def _build_sdk_messages(self, signals_summary: str) -> List[Dict[str, Any]]:
+        """
+        Build the SDK message list with the static prompt prefix cached.
+
+        Args:
+            signals_summary: Serialized signals to analyze
+
+        Returns:
+            Messages payload for messages.create
+        """
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": ANALYSIS_PROMPT_PREFIX,
+                        "cache_control": {"type": "ephemeral"}
+                    },
+                    {
+                        "type": "text",
+                        "text": signals_summary + _ANALYSIS_PROMPT_SUFFIX
+                    }
+                ]
+            }
+        ]
+
+    def _call_claude_sdk(self, signals_summary: str, model: str, max_tokens: int = 4000) -> str:
         """
         Call Claude using the Python SDK.
 
         Args:
-            prompt: Analysis prompt
+            signals_summary: Serialized signals to analyze
+            model: Model to run the prompt on
+            max_tokens: Maximum tokens in the response
 
         Returns:
             Claude's response
@@ -189,68 +475,112 @@ class PatternAnalyzer:
             ImportError: If anthropic SDK is not installed
             Exception: If API call fails
         """
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError(
-                "anthropic SDK not installed. Install with: pip install anthropic\n"
-                "Or use --use-cli flag to use the Claude CLI instead."
-            )
-
-        if not self.api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY environment variable not set and no API key provided"
-            )
-
-        client = anthropic.Anthropic(api_key=self.api_key)
-
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+        response = self._sdk.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=self._build_sdk_messages(signals_summary)
         )
 
         return response.content[0].text
 
-    def _call_claude_with_retry(self, prompt: str) -> str:
+    def _call_claude_with_retry(
+        self,
+        signals_summary: str,
+        model: str,
+        max_tokens: int = 4000
+    ) -> str:
         """
         Call Claude with retry logic for transient failures.
 
+        Only connection errors, timeouts, rate limits and server errors are
+        retried; anything else (bad request, missing API key) is raised at once.
+
         Args:
-            prompt: Analysis prompt
+            signals_summary: Serialized signals to analyze
+            model: Model to run the prompt on
+            max_tokens: Maximum tokens in the response (SDK only)
 
         Returns:
             Claude's response
 
         Raises:
-            Exception: If all retry attempts fail
+            Exception: If all retry attempts fail or the error is not transient
         """
         last_error = None
+        # Rough input size: ~4 characters per token
+        estimated_tokens = (len(ANALYSIS_PROMPT) + len(signals_summary)) // 4
 
         for attempt in range(self.max_retries):
+            self._limiter.acquire(estimated_tokens)
             try:
                 if self.use_cli:
-                    return self._call_claude_cli(prompt)
+                    return self._call_claude_cli(
+                        ANALYSIS_PROMPT_PREFIX + signals_summary + _ANALYSIS_PROMPT_SUFFIX, model
+                    )
                 else:
-                    return self._call_claude_sdk(prompt)
+                    return self._call_claude_sdk(signals_summary, model, max_tokens)
             except Exception as e:
+                if not _is_transient(e):
+                    raise
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (attempt + 1)
                     print(
                         f"Warning: API call failed (attempt {attempt + 1}/{self.max_retries}): {e}",
                         file=sys.stderr
                     )
-                    print(f"Retrying in {wait_time} seconds...", file=sys.stderr)
-                    time.sleep(wait_time)
+                    retry_after = self._retry_after(e)
+                    if retry_after is not None:
+                        # Let the limiter hold every caller until the server is ready
+                        print(f"Server asked to retry in {retry_after:.1f} seconds...", file=sys.stderr)
+                        self._limiter.penalty(retry_after)
+                    else:
+                        # No server hint: jittered exponential backoff
+                        wait_time = self.retry_delay * 2 ** attempt
+                        wait_time += random.uniform(0, 0.25 * wait_time)
+                        print(f"Retrying in {wait_time:.1f} seconds...", file=sys.stderr)
+                        time.sleep(wait_time)
 
         raise Exception(f"All {self.max_retries} retry attempts failed. Last error: {last_error}")
 
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """
+        Extract the server-advertised retry delay from a failed API call.
+
+        SDK errors carry response headers: retry-after (seconds or an HTTP
+        date) or the anthropic-ratelimit-*-reset timestamps. CLI errors only
+        carry stderr text, which is searched for a retry-after line.
+
+        Args:
+            error: Exception raised by an API call
+
+        Returns:
+            Seconds to wait, or None if the server gave no hint
+        """
+        anthropic = sys.modules.get('anthropic')  # Only set once an SDK call was made
+        if anthropic is not None and isinstance(error, anthropic.APIStatusError):
+            headers = error.response.headers
+            retry_after = headers.get('retry-after')
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    try:
+                        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                    except (TypeError, ValueError):
+                        pass
+
+            for header in ('anthropic-ratelimit-requests-reset', 'anthropic-ratelimit-tokens-reset'):
+                reset = headers.get(header)
+                if reset:
+                    try:
+                        return max(0.0, datetime.fromisoformat(reset).timestamp() - time.time())
+                    except ValueError:
+                        continue
+            return None
+
+        match = re.search(r'retry-after:\s*(\d+(?:\.\d+)?)', str(error), re.IGNORECASE)
+        return float(match.group(1)) if match else None
+
     def _parse_claude_response(self, response: str) -> Dict[str, Any]:
         """
         Parse Claude's JSON response.
@@ -264,18 +594,28 @@ class PatternAnalyzer:
         Raises:
             json.JSONDecodeError: If response is not valid JSON
         """
-        # Claude sometimes wraps JSON in markdown code blocks
-        response = response.strip()
-        if response.startswith('```'):
-            # Remove markdown code block markers
-            lines = response.split('\n')
-            # Remove first line (```json or ```)
-            lines = lines[1:]
-            # Remove last line (```)
-            if lines[-1].strip() == '```':
-                lines = lines[:-1]
-            response = '\n'.join(lines)
+        # Common case: the response is exactly one JSON document
+        try:
+            return _loads(response)
+        except json.JSONDecodeError:
+            pass
 
+        # Claude sometimes wraps JSON in markdown code blocks or adds prose around
+        # it, so decode the first complete object instead of the whole response
+        decoder = json.JSONDecoder()
+        start = response.find('{')
+        first_error = None
+
+        while start != -1:
+            try:
+                parsed, _ = decoder.raw_decode(response, start)
+                return parsed
+            except json.JSONDecodeError as e:
+                first_error = first_error or e
+                start = response.find('{', start + 1)
+
+        if first_error:
+            raise first_error
         return json.loads(response)
 
     def _calculate_pattern_score(self, pattern: Dict[str, Any]) -> float:
@@ -290,24 +630,8 @@ class PatternAnalyzer:
         Returns:
             Numeric score (higher is more important)
         """
-        # Impact scoring
-        impact_scores = {
-            'high': 3.0,
-            'medium': 2.0,
-            'low': 1.0
-        }
-        impact = pattern.get('impact', 'low').lower()
-        impact_value = impact_scores.get(impact, 1.0)
-
-        # Frequency scoring
-        frequency_scores = {
-            'daily': 4.0,
-            'weekly': 3.0,
-            'per-feature': 2.0,
-            'monthly': 1.0
-        }
-        frequency = pattern.get('frequency', 'monthly').lower()
-        frequency_value = frequency_scores.get(frequency, 1.0)
+        impact_value = IMPACT_SCORES.get(pattern.get('impact', 'low').lower(), 1.0)
+        frequency_value = FREQUENCY_SCORES.get(pattern.get('frequency', 'monthly').lower(), 1.0)
 
         return impact_value * frequency_value
 
@@ -321,11 +645,11 @@ class PatternAnalyzer:
         Returns:
             Dictionary with ranked patterns:
             {
-                "timestamp": "ISO-8601 datetime",
+                "timestamp": "ISO-8601 UTC datetime",
                 "patterns": [pattern_objects],
                 "metadata": {
                     "total_patterns_found": N,
-                    "api_method": "cli" | "sdk" | "mock",
+                    "api_method": "cli" | "sdk" | "mock" | "batch" | "cache",
                     "signals_analyzed": {
                         "git_signals": N,
                         "memory_signals": N,
@@ -339,44 +663,362 @@ class PatternAnalyzer:
         # Handle mock mode
         if self.mock:
             print("Using mock patterns (--mock flag enabled)", file=sys.stderr)
-            patterns = MOCK_PATTERNS['patterns']
+            # Fresh dicts: scoring adds 'score', which must not leak into the template
+            patterns = [dict(pattern) for pattern in MOCK_PATTERNS['patterns']]
         else:
-            # Prepare signals summary for prompt
-            signals_summary = json.dumps({
-                'git_signals': signals.get('git_signals', [])[:20],  # Limit to avoid token limits
-                'memory_signals': signals.get('memory_signals', [])[:10],
-                'churn_signals': signals.get('churn_signals', [])[:10],
-                'summary': signals.get('summary', {})
-            }, indent=2)
+            signals_summary = self._summarize_signals(signals)
 
-            # Create analysis prompt
-            prompt = ANALYSIS_PROMPT.format(signals=signals_summary)
+            cached = self._load_cached_patterns(signals_summary)
+            if cached is not None:
+                print(f"Using {len(cached)} cached patterns for identical signals", file=sys.stderr)
+                return self._build_result(signals, cached, 'cache')
 
             # Call Claude with retry logic
             try:
-                response = self._call_claude_with_retry(prompt)
-                parsed = self._parse_claude_response(response)
-                patterns = parsed.get('patterns', [])
+                patterns = self._identify_patterns(signals_summary)
                 print(f"Claude identified {len(patterns)} patterns", file=sys.stderr)
+                self._store_cached_patterns(signals_summary, patterns)
             except Exception as e:
                 print(f"Error calling Claude API: {e}", file=sys.stderr)
                 print("Falling back to empty pattern list", file=sys.stderr)
                 patterns = []
 
-        # Calculate scores and rank patterns
-        for pattern in patterns:
-            pattern['score'] = self._calculate_pattern_score(pattern)
+        api_method = 'mock' if self.mock else ('cli' if self.use_cli else 'sdk')
+        return self._build_result(signals, patterns, api_method)
+
+    def _identify_patterns(self, signals_summary: str) -> List[Dict[str, Any]]:
+        """
+        Ask Claude for patterns, trying the cheap triage model first if configured.
+
+        The analysis model only runs when triage fails or finds a promising
+        signal set: at least min_patterns patterns, or any high-impact one.
+
+        Args:
+            signals_summary: Serialized signals to analyze
+
+        Returns:
+            Patterns identified by Claude
+
+        Raises:
+            Exception: If the analysis call fails
+        """
+        if self.triage_model:
+            try:
+                response = self._call_claude_with_retry(
+                    signals_summary, self.triage_model, TRIAGE_MAX_TOKENS
+                )
+                patterns = self._parse_claude_response(response).get('patterns', [])
+                promising = len(patterns) >= self.min_patterns or any(
+                    str(p.get('impact', '')).lower() == 'high' for p in patterns
+                )
+                if not promising:
+                    print(
+                        f"Triage with {self.triage_model} found {len(patterns)} low-impact "
+                        "patterns; skipping full analysis",
+                        file=sys.stderr
+                    )
+                    return patterns
+                print(
+                    f"Triage found {len(patterns)} patterns; running full analysis "
+                    f"with {self.analysis_model}",
+                    file=sys.stderr
+                )
+            except Exception as e:
+                print(f"Warning: Triage failed, running full analysis: {e}", file=sys.stderr)
+
+        response = self._call_claude_with_retry(signals_summary, self.analysis_model)
+        return self._parse_claude_response(response).get('patterns', [])
+
+    def analyze_batch(self, signals_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several signal sets through the Message Batches API.
+
+        All prompts are submitted as one batch, which is billed at a discount and
+        processed in parallel server-side. Mock and CLI modes have no batch
+        endpoint, so they fall back to calling analyze() for each signal set.
+
+        Args:
+            signals_list: List of dictionaries from collect.py
+
+        Returns:
+            List of analyze()-style results, in the same order as signals_list
+        """
+        if self.mock or self.use_cli:
+            return [self.analyze(signals) for signals in signals_list]
+
+        summaries = [self._summarize_signals(signals) for signals in signals_list]
+        patterns_by_index: Dict[int, List[Dict[str, Any]]] = {}
+        methods = ['batch'] * len(signals_list)
+
+        for i, signals_summary in enumerate(summaries):
+            cached = self._load_cached_patterns(signals_summary)
+            if cached is not None:
+                patterns_by_index[i] = cached
+                methods[i] = 'cache'
+
+        pending = [i for i in range(len(signals_list)) if i not in patterns_by_index]
+        if pending:
+            print(f"Submitting batch of {len(pending)} analyses to Claude...", file=sys.stderr)
+            self._run_batch(summaries, pending, patterns_by_index)
+
+        return [
+            self._build_result(signals, patterns_by_index.get(i, []), methods[i])
+            for i, signals in enumerate(signals_list)
+        ]
+
+    async def analyze_async(self, signals: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze signals without blocking the event loop.
+
+        The analysis runs in a worker thread so the retry loop, rate limiter,
+        triage pass and cache are shared with analyze().
+
+        Args:
+            signals: Dictionary from collect.py with git, memory, and churn signals
+
+        Returns:
+            Dictionary with timestamp, patterns, and metadata
+        """
+        return await asyncio.to_thread(self.analyze, signals)
+
+    async def analyze_many_async(
+        self,
+        signals_list: List[Dict[str, Any]],
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several signal sets concurrently in real time.
 
-        # Sort by score (descending)
-        patterns.sort(key=lambda p: p['score'], reverse=True)
+        Unlike analyze_batch(), results arrive as soon as each call finishes
+        rather than when the whole batch completes.
+
+        Args:
+            signals_list: List of dictionaries from collect.py
+            concurrency: Maximum number of analyses in flight at once
+
+        Returns:
+            List of analyze()-style results, in the same order as signals_list
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(signals: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_async(signals)
+
+        return await asyncio.gather(*(run(signals) for signals in signals_list))
+
+    def _run_batch(
+        self,
+        summaries: List[str],
+        indices: List[int],
+        patterns_by_index: Dict[int, List[Dict[str, Any]]],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0
+    ):
+        """
+        Submit one Message Batches job and collect its parsed patterns.
+
+        Args:
+            summaries: Serialized signals for every input, by index
+            indices: Which inputs to include in the batch
+            patterns_by_index: Filled in with the patterns for each succeeded input
+            poll_interval: Initial seconds between batch status checks
+            max_poll_interval: Upper bound for the status check backoff
+        """
+        try:
+            requests = [
+                {
+                    'custom_id': f'a{i}',
+                    'params': {
+                        'model': self.analysis_model,
+                        'max_tokens': 4000,
+                        'messages': self._build_sdk_messages(summaries[i])
+                    }
+                }
+                for i in indices
+            ]
+            batch = self._sdk.messages.batches.create(requests=requests)
+
+            # Poll with exponential backoff until the batch has finished
+            delay = poll_interval
+            while batch.processing_status != 'ended':
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = self._sdk.messages.batches.retrieve(batch.id)
+
+            for entry in self._sdk.messages.batches.results(batch.id):
+                index = int(entry.custom_id[1:])
+                if entry.result.type != 'succeeded':
+                    print(
+                        f"Warning: Batch request {entry.custom_id} {entry.result.type}",
+                        file=sys.stderr
+                    )
+                    continue
+                try:
+                    parsed = self._parse_claude_response(entry.result.message.content[0].text)
+                    patterns_by_index[index] = parsed.get('patterns', [])
+                    self._store_cached_patterns(summaries[index], patterns_by_index[index])
+                except json.JSONDecodeError as e:
+                    print(
+                        f"Warning: Invalid JSON in batch response {entry.custom_id}: {e}",
+                        file=sys.stderr
+                    )
+        except Exception as e:
+            print(f"Error calling Claude batch API: {e}", file=sys.stderr)
+            print("Falling back to empty pattern lists", file=sys.stderr)
+
+    def _cache_path(self, signals_summary: str) -> Path:
+        """
+        Location of the cached patterns for a prompt.
+
+        The key covers the model and the full prompt text, so any change to the
+        instructions or the selected signals misses the cache.
+
+        Args:
+            signals_summary: Serialized signals sent to Claude
+
+        Returns:
+            Path of the cache file (may not exist)
+        """
+        key = hashlib.sha256(
+            f"{self.analysis_model}\0{self.triage_model}\0{ANALYSIS_PROMPT}\0"
+            f"{signals_summary}".encode('utf-8')
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cached_patterns(self, signals_summary: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load patterns cached for an identical prompt.
+
+        Args:
+            signals_summary: Serialized signals sent to Claude
+
+        Returns:
+            Cached pattern list, or None on a miss, an expired or empty entry,
+            or caching disabled
+        """
+        if not self.use_cache:
+            return None
+
+        path = self._cache_path(signals_summary)
+        try:
+            if self.cache_ttl is not None and time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            # An empty list (possibly written before empty results stopped being
+            # cached) is treated as a miss so Claude is asked again
+            return _loads(path.read_bytes())['patterns'] or None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_patterns(self, signals_summary: str, patterns: List[Dict[str, Any]]):
+        """
+        Cache patterns for a prompt, writing atomically so readers never see partial files.
+
+        Args:
+            signals_summary: Serialized signals sent to Claude
+            patterns: Patterns Claude identified (before scoring)
+        """
+        # An empty list usually means an empty or unparseable reply; retry it next run
+        if not self.use_cache or not patterns:
+            return
+
+        path = self._cache_path(signals_summary)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as f:
+                f.write(_dumps({'patterns': patterns}))
+            os.replace(f.name, path)
+        except OSError as e:
+            print(f"Warning: Failed to write analysis cache: {e}", file=sys.stderr)
+
+    def _pack_signals(self, signals: Dict[str, Any], budget: int) -> Dict[str, List[Any]]:
+        """
+        Select as many signals as fit in a token budget.
+
+        Categories are drained round-robin so each gets a fair share. Signals
+        arrive ranked, so a category stops at its first signal that does not fit
+        rather than skipping ahead to lower-ranked ones.
+
+        Args:
+            signals: Dictionary from collect.py
+            budget: Approximate number of tokens available for signals
+
+        Returns:
+            Dictionary mapping each signal category to the selected signals
+        """
+        packed: Dict[str, List[Any]] = {category: [] for category in SIGNAL_CATEGORIES}
+        queues = [(category, iter(signals.get(category, []))) for category in SIGNAL_CATEGORIES]
+
+        while queues:
+            for queue in list(queues):
+                category, items = queue
+                item = next(items, None)
+                if item is None:
+                    queues.remove(queue)
+                    continue
+
+                # ~4 characters per token, plus one for the separating comma
+                cost = len(_dumps(item)) // 4 + 1
+                if cost > budget:
+                    queues.remove(queue)
+                    continue
+
+                packed[category].append(item)
+                budget -= cost
+
+        return packed
+
+    def _summarize_signals(self, signals: Dict[str, Any]) -> str:
+        """
+        Serialize the subset of signals sent to Claude.
+
+        Args:
+            signals: Dictionary from collect.py
+
+        Returns:
+            Compact JSON string for the prompt
+        """
+        summary = signals.get('summary', {})
+        fixed_size = len(ANALYSIS_PROMPT) + len(_dumps(summary))
+        summary_data = self._pack_signals(signals, self.max_prompt_tokens - fixed_size // 4)
+        summary_data['summary'] = summary
+
+        return _dumps(summary_data)
+
+    def _build_result(
+        self,
+        signals: Dict[str, Any],
+        patterns: List[Dict[str, Any]],
+        api_method: str
+    ) -> Dict[str, Any]:
+        """
+        Score, rank, and wrap patterns in the analyze() result structure.
+
+        Args:
+            signals: Dictionary the patterns were derived from
+            patterns: Patterns identified by Claude (or mock data)
+            api_method: How the patterns were obtained
+
+        Returns:
+            Result dictionary as documented on analyze()
+        """
+        # Score each pattern once, then rank by plain (-score, position) tuples so
+        # the sort compares natively and ties keep Claude's order
+        scores = [self._calculate_pattern_score(pattern) for pattern in patterns]
+        ranking = sorted((-score, i) for i, score in enumerate(scores))
+        patterns = [patterns[i] for _, i in ranking]
+        for pattern, (neg_score, _) in zip(patterns, ranking):
+            pattern['score'] = -neg_score
 
         # Prepare results
         result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(_UTC).isoformat(timespec='seconds'),
             'patterns': patterns,
             'metadata': {
                 'total_patterns_found': len(patterns),
-                'api_method': 'mock' if self.mock else ('cli' if self.use_cli else 'sdk'),
+                'api_method': api_method,
                 'signals_analyzed': {
                     'git_signals': len(signals.get('git_signals', [])),
                     'memory_signals': len(signals.get('memory_signals', [])),
@@ -388,15 +1030,139 @@ class PatternAnalyzer:
         return result
 
 
-def main():
-    """Main entry point for CLI usage."""
+def _read_json(path: Optional[str]) -> Any:
+    """
+    Read a JSON document from a file, or from stdin when no path is given.
+
+    The input is read in one buffered binary read and decoded in memory,
+    avoiding the many small reads a text-mode json.load can issue.
+
+    Args:
+        path: Input file path, or None for stdin
+
+    Returns:
+        Parsed JSON data
+    """
+    if path:
+        with open(path, 'rb', buffering=1 << 20) as f:
+            return _loads(f.read())
+    # A substituted text stdin (e.g. io.StringIO) has no binary buffer
+    buffer = getattr(sys.stdin, 'buffer', None)
+    return _loads(buffer.read() if buffer is not None else sys.stdin.read())
+
+
+def _write_output(results: Dict[str, Any], path: Optional[str], pretty: bool = False):
+    """
+    Serialize results straight to a file or stdout without an intermediate str.
+
+    orjson produces bytes that are written as-is; the stdlib fallback streams
+    through json.dump. Either way no decoded/re-encoded copy of the output is
+    held in memory.
+
+    Args:
+        results: Results to serialize
+        path: Output file path, or None for stdout
+        pretty: Indent the JSON output
+    """
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if path:
+            with open(path, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b'\n')
+            sys.stdout.buffer.flush()
+    else:
+        options = {'indent': 2} if pretty else {'separators': (',', ':')}
+        if path:
+            with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(results, f, **options)
+        else:
+            json.dump(results, sys.stdout, **options)
+            sys.stdout.write('\n')
+
+    if path:
+        print(f"\nResults written to {path}", file=sys.stderr)
+
+
+def _main_batch(args: argparse.Namespace, analyzer: PatternAnalyzer) -> int:
+    """
+    Analyze every JSON file in --batch-input or --input-dir.
+
+    --batch-input submits a single Message Batches API request; --input-dir
+    runs up to --concurrency real-time analyses at once.
+
+    Args:
+        args: Parsed command-line arguments
+        analyzer: Configured pattern analyzer
+
+    Returns:
+        Process exit code
+    """
+    input_dir = args.batch_input or args.input_dir
+    input_files = sorted(Path(input_dir).glob('*.json'))
+    if not input_files:
+        print(f"Error: No JSON files found in {input_dir}", file=sys.stderr)
+        return 1
+
+    signals_list = [_read_json(input_file) for input_file in input_files]
+
+    if args.batch_input:
+        analyses = analyzer.analyze_batch(signals_list)
+    else:
+        analyses = asyncio.run(analyzer.analyze_many_async(signals_list, args.concurrency))
+
+    for analysis in analyses:
+        analysis['patterns'] = analysis['patterns'][:args.top_n]
+        analysis['metadata']['patterns_returned'] = len(analysis['patterns'])
+
+    results = {
+        'timestamp': datetime.now(_UTC).isoformat(timespec='seconds'),
+        'results': [
+            {'input': str(input_file), **analysis}
+            for input_file, analysis in zip(input_files, analyses)
+        ]
+    }
+
+    # Write output
+    _write_output(results, args.output, args.pretty)
+
+    # Print summary
+    print("\n=== Batch Analysis Summary ===", file=sys.stderr)
+    for entry in results['results']:
+        print(
+            f"{entry['input']}: {entry['metadata']['total_patterns_found']} patterns "
+            f"({entry['metadata']['api_method']})",
+            file=sys.stderr
+        )
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Analyze pattern detection signals using Claude AI.'
     )
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group()
+    input_group.add_argument(
         '--input',
         help='Input JSON file from collect.py (default: read from stdin)'
     )
+    input_group.add_argument(
+        '--batch-input',
+        help='Directory of collect.py JSON files to analyze in one Message Batches API request'
+    )
+    input_group.add_argument(
+        '--input-dir',
+        help='Directory of collect.py JSON files to analyze concurrently in real time'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (default: print to stdout)'
@@ -406,11 +1172,20 @@ def main():
         action='store_true',
         help='Use mock data instead of calling Claude API'
     )
-    parser.add_argument(
+    api_group = parser.add_mutually_exclusive_group()
+    api_group.add_argument(
         '--use-sdk',
-        action='store_true',
+        dest='use_cli',
+        action='store_false',
         help='Use Anthropic Python SDK instead of Claude CLI'
     )
+    api_group.add_argument(
+        '--use-cli',
+        dest='use_cli',
+        action='store_true',
+        help='Use Claude CLI instead of Anthropic Python SDK'
+    )
+    parser.set_defaults(use_cli=None)
     parser.add_argument(
         '--api-key',
         help='Anthropic API key (default: use ANTHROPIC_API_KEY env var)'
@@ -426,24 +1201,80 @@ def main():
         action='store_true',
         help='Pretty-print JSON output'
     )
+    parser.add_argument(
+        '--max-prompt-tokens',
+        type=int,
+        default=6000,
+        help='Approximate prompt size to fill with signals (default: 6000)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call Claude, ignoring cached results for identical signals'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=7 * 24 * 3600,
+        help='Seconds before cached results expire (default: 604800, 7 days)'
+    )
+    parser.add_argument(
+        '--analysis-model',
+        default=ANALYSIS_MODEL,
+        help=f'Model for the full analysis (default: {ANALYSIS_MODEL})'
+    )
+    parser.add_argument(
+        '--triage-model',
+        help='Cheaper model (e.g. claude-haiku-4-5) for a first pass; '
+             'the analysis model only runs on promising results (default: no triage)'
+    )
+    parser.add_argument(
+        '--min-patterns',
+        type=int,
+        default=3,
+        help='Triage pattern count that triggers full analysis (default: 3)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum analyses in flight with --input-dir (default: 4)'
+    )
+    parser.add_argument(
+        '--rpm',
+        type=int,
+        help='Throttle to N API requests per minute (default: unlimited)'
+    )
+    parser.add_argument(
+        '--tpm',
+        type=int,
+        help='Throttle to N input tokens per minute (default: unlimited)'
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
-        # Read input
-        if args.input:
-            with open(args.input, 'r') as f:
-                signals = json.load(f)
-        else:
-            signals = json.load(sys.stdin)
-
         # Initialize analyzer
         analyzer = PatternAnalyzer(
             api_key=args.api_key,
-            use_cli=not args.use_sdk,
-            mock=args.mock
+            use_cli=args.use_cli,
+            mock=args.mock,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            max_prompt_tokens=args.max_prompt_tokens,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+            analysis_model=args.analysis_model,
+            triage_model=args.triage_model,
+            min_patterns=args.min_patterns
         )
 
+        if args.batch_input or args.input_dir:
+            return _main_batch(args, analyzer)
+
+        # Read input
+        signals = _read_json(args.input)
+
         # Analyze patterns
         results = analyzer.analyze(signals)
 
@@ -451,19 +1282,8 @@ def main():
         results['patterns'] = results['patterns'][:args.top_n]
         results['metadata']['patterns_returned'] = len(results['patterns'])
 
-        # Format output
-        if args.pretty:
-            output = json.dumps(results, indent=2)
-        else:
-            output = json.dumps(results)
-
         # Write output
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output)
-            print(f"\nResults written to {args.output}", file=sys.stderr)
-        else:
-            print(output)
+        _write_output(results, args.output, args.pretty)
 
         # Print summary
         print("\n=== Analysis Summary ===", file=sys.stderr)
@@ -487,7 +1307,6 @@ def main():
         return 1
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
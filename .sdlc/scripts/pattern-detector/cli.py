@@ -33,14 +33,151 @@ Features:
 """
 
 import argparse
+import contextlib
+import copy
+import functools
+import importlib.util
+import io
 import json
 import os
-import subprocess
 import sys
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, TypedDict
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional streaming parser; whole-file parsing is the fallback
+    ijson = None
+
+try:
+    import readline  # noqa: F401 - importing it gives input() line editing and history
+except ImportError:  # Not available on Windows
+    readline = None
+
+try:
+    import termios
+    import tty
+except ImportError:  # POSIX only; prompts fall back to input()
+    termios = None
+    tty = None
+
+# Directory holding the pipeline stage scripts (collect.py, analyze.py, ...)
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Agent memory file collect.py reads by default; edits to it do not move HEAD
+AGENT_MEMORY_PATH = Path.home() / '.agent-memory' / 'memories.json'
+
+# A hunt with unchanged inputs is skipped only this soon after the last one,
+# since the --days window slides forward even when nothing else changes
+HUNT_SKIP_MAX_AGE = timedelta(hours=24)
+
+# Stage script paths, as strings ready for command lines and module loading
+STAGE_SCRIPTS = {
+    name: str(SCRIPT_DIR / f'{name}.py')
+    for name in (
+        'collect', 'analyze', 'generate_tests', 'propose_updates',
+        'update_precommit', 'update_memory'
+    )
+}
+
+# Stage modules imported so far, keyed by script name
+_STAGE_MODULES: Dict[str, Any] = {}
+
+# Fixed stand-ins used by --dry-run in place of analyze.py/propose_updates.py output
+_MOCK_PATTERNS: Tuple[Dict[str, Any], ...] = (
+    {
+        'name': 'Mock Pattern 1',
+        'description': 'This is a mock pattern for dry-run testing',
+        'evidence': ['file1.py', 'file2.py'],
+        'frequency': 'weekly',
+        'impact': 'high',
+        'root_cause': 'Mock root cause'
+    },
+)
+
+_MOCK_PROPOSALS: Tuple[Dict[str, Any], ...] = (
+    {
+        'agent': 'Dev-Backend',
+        'pattern_name': 'Mock Pattern 1',
+        'non_negotiable': '- [ ] NEVER use mock patterns',
+        'discipline': 'Always validate before using',
+        'memory': 'Learned: Mock patterns are for testing',
+        'memory_tags': ['anti-patterns', 'mock']
+    },
+)
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize to JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_items_cached(path: str, key: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Read the list under a top-level key of a JSON file, memoized on its
+    path and modification time.
+
+    With ijson installed only that list is materialized; the rest of the
+    document is streamed past. The mtime is part of the key, so a
+    rewritten file is read again. Results are shared between callers and
+    must not be mutated.
+
+    Args:
+        path: File to read
+        key: Top-level key holding the list (e.g. 'patterns')
+        mtime_ns: The file's current st_mtime_ns
+
+    Returns:
+        Items of the list, or an empty list if the key is missing
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            return list(ijson.items(f, f'{key}.item', use_float=True))
+
+    data = Path(path).read_bytes()
+    document = orjson.loads(data) if orjson is not None else json.loads(data)
+    return document.get(key, [])
+
+
+def _load_items(path: Path, key: str) -> List[Dict[str, Any]]:
+    """Load the list under a top-level JSON key through the mtime-keyed cache."""
+    return _load_items_cached(str(path), key, path.stat().st_mtime_ns)
+
+
+def _load_stage(name: str) -> Any:
+    """
+    Import a sibling stage script once and return the cached module.
+
+    The scripts live in a directory that is not an importable package, so
+    they are loaded by path.
+
+    Args:
+        name: Script name without the .py suffix (e.g. 'collect')
+
+    Returns:
+        The imported module
+    """
+    module = _STAGE_MODULES.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            f'pattern_detector_{name}', STAGE_SCRIPTS[name]
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _STAGE_MODULES[name] = module
+    return module
+
 
 # ANSI color codes for better UX
 class Colors:
@@ -66,19 +203,9 @@ class Colors:
     @classmethod
     def disable(cls):
         """Disable colors (for non-TTY output)."""
-        cls.RESET = ''
-        cls.BOLD = ''
-        cls.DIM = ''
-        cls.RED = ''
-        cls.GREEN = ''
-        cls.YELLOW = ''
-        cls.BLUE = ''
-        cls.MAGENTA = ''
-        cls.CYAN = ''
-        cls.WHITE = ''
-        cls.BG_RED = ''
-        cls.BG_GREEN = ''
-        cls.BG_YELLOW = ''
+        for name in ('RESET', 'BOLD', 'DIM', 'RED', 'GREEN', 'YELLOW', 'BLUE',
+                     'MAGENTA', 'CYAN', 'WHITE', 'BG_RED', 'BG_GREEN', 'BG_YELLOW'):
+            setattr(cls, name, '')
 
 
 # Disable colors if not a TTY
@@ -86,10 +213,88 @@ if not sys.stdout.isatty():
     Colors.disable()
 
 
+class _LineWriter(io.BufferedIOBase):
+    """
+    Binary stream that hands each complete line to a callback as it is written.
+
+    Wrapped in a TextIOWrapper it stands in for sys.stdout, so stages can
+    write text or bytes (via sys.stdout.buffer) as they would in a subprocess.
+    """
+
+    def __init__(self, emit: Callable[[str], None]):
+        """
+        Initialize line writer.
+
+        Args:
+            emit: Called with each decoded line, without its trailing newline
+        """
+        self._emit = emit
+        self._partial = b''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        lines = (self._partial + bytes(data)).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._emit(line.decode('utf-8', errors='replace'))
+        return len(data)
+
+    def close(self):
+        if self._partial:
+            self._emit(self._partial.decode('utf-8', errors='replace'))
+            self._partial = b''
+        super().close()
+
+
+def _text_stream(buffer: io.BufferedIOBase) -> io.TextIOWrapper:
+    """
+    Text stream over a binary one, like a process's standard streams.
+
+    Args:
+        buffer: Binary stream exposed as the result's .buffer
+
+    Returns:
+        UTF-8 text wrapper that passes every write straight to the buffer
+    """
+    return io.TextIOWrapper(buffer, encoding='utf-8', write_through=True)
+
+
+class HuntState(TypedDict):
+    """Workflow state persisted between runs in state.json."""
+    last_run: Optional[str]
+    last_collection: Optional[str]
+    last_analysis: Optional[str]
+    patterns_pending_review: List[Dict[str, Any]]
+    patterns_approved: List[Dict[str, Any]]
+    last_hunt_inputs: Optional[Dict[str, Any]]
+
+
+STATE_KEYS = tuple(HuntState.__annotations__)
+
+
+def _default_state() -> HuntState:
+    """Build the state for a first run, with every key present."""
+    state = dict.fromkeys(STATE_KEYS)
+    state['patterns_pending_review'] = []
+    state['patterns_approved'] = []
+    return state
+
+
 class PatternHunterCLI:
     """Main CLI orchestrator for pattern detection workflow."""
 
-    def __init__(self, repo_path: Optional[Path] = None, dry_run: bool = False, auto: bool = False):
+    # Parsed state files keyed by path, with the mtime they were read at
+    _STATE_CACHE: Dict[Path, Tuple[float, HuntState]] = {}
+
+    def __init__(
+        self,
+        repo_path: Optional[Path] = None,
+        dry_run: bool = False,
+        auto: bool = False,
+        isolate: bool = False
+    ):
         """
         Initialize Pattern Hunter CLI.
 
@@ -97,10 +302,24 @@ class PatternHunterCLI:
             repo_path: Path to repository (default: current directory)
             dry_run: If True, show plans without executing
             auto: If True, auto-approve all prompts
+            isolate: If True, run each stage in its own Python subprocess
+                instead of calling it in-process
         """
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
         self.dry_run = dry_run
         self.auto = auto
+        self.isolate = isolate
+        # Prefix/suffix per message kind, fixed once colors are settled, so
+        # printing is a single concatenation and write
+        self._styles = {
+            'success': (f"{Colors.GREEN}✓ ", f"{Colors.RESET}\n"),
+            'error': (f"{Colors.RED}✗ ", f"{Colors.RESET}\n"),
+            'warning': (f"{Colors.YELLOW}⚠ ", f"{Colors.RESET}\n"),
+            'info': (f"{Colors.CYAN}→ ", f"{Colors.RESET}\n"),
+            'dim': (Colors.DIM, f"{Colors.RESET}\n")
+        }
+        # One timestamp per run, shared by every artifact it writes
+        self.run_tag = datetime.now().strftime("%Y%m%d-%H%M%S")
         self.state_dir = self.repo_path / '.sdlc' / 'pattern-hunter'
         self.state_file = self.state_dir / 'state.json'
 
@@ -108,30 +327,42 @@ class PatternHunterCLI:
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
         # Load or initialize state
+        self._last_serialized: Optional[str] = None
         self.state = self._load_state()
 
-    def _load_state(self) -> Dict[str, Any]:
-        """Load state from previous runs."""
+    def _load_state(self) -> HuntState:
+        """Load state from previous runs, reusing the parsed copy if unchanged."""
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    return json.load(f)
+                mtime = self.state_file.stat().st_mtime
+                cached = self._STATE_CACHE.get(self.state_file)
+                if cached is None or cached[0] != mtime:
+                    with open(self.state_file) as f:
+                        cached = (mtime, json.load(f))
+                    self._STATE_CACHE[self.state_file] = cached
+                return copy.deepcopy(cached[1])
             except Exception as e:
                 self._print_warning(f"Failed to load state: {e}")
 
-        return {
-            'last_run': None,
-            'last_collection': None,
-            'last_analysis': None,
-            'patterns_pending_review': [],
-            'patterns_approved': []
-        }
+        return _default_state()
 
     def _save_state(self):
-        """Save state for future runs."""
+        """
+        Save state for future runs.
+
+        Written immediately, so a crash or kill later in the run keeps it;
+        skipped if the state is unchanged since the last write.
+        """
         try:
+            serialized = _dumps(self.state, pretty=True)
+            if serialized == self._last_serialized:
+                return
             with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+                f.write(serialized)
+            self._last_serialized = serialized
+            self._STATE_CACHE[self.state_file] = (
+                self.state_file.stat().st_mtime, copy.deepcopy(self.state)
+            )
         except Exception as e:
             self._print_warning(f"Failed to save state: {e}")
 
@@ -150,29 +381,62 @@ class PatternHunterCLI:
 
     def _print_success(self, message: str):
         """Print success message."""
-        print(f"{Colors.GREEN}✓ {message}{Colors.RESET}")
+        prefix, suffix = self._styles['success']
+        sys.stdout.write(prefix + message + suffix)
 
     def _print_error(self, message: str):
         """Print error message."""
-        print(f"{Colors.RED}✗ {message}{Colors.RESET}", file=sys.stderr)
+        prefix, suffix = self._styles['error']
+        sys.stderr.write(prefix + message + suffix)
 
     def _print_warning(self, message: str):
         """Print warning message."""
-        print(f"{Colors.YELLOW}⚠ {message}{Colors.RESET}")
+        prefix, suffix = self._styles['warning']
+        sys.stdout.write(prefix + message + suffix)
 
     def _print_info(self, message: str):
         """Print info message."""
-        print(f"{Colors.CYAN}→ {message}{Colors.RESET}")
+        prefix, suffix = self._styles['info']
+        sys.stdout.write(prefix + message + suffix)
 
-    def _print_dim(self, message: str):
+    def _print_dim(self, message: str, file: Optional[TextIO] = None):
         """Print dimmed message."""
-        print(f"{Colors.DIM}{message}{Colors.RESET}")
+        prefix, suffix = self._styles['dim']
+        (file or sys.stdout).write(prefix + message + suffix)
 
-    def _progress(self, message: str, delay: float = 0.5):
-        """Show progress indicator."""
-        print(f"{Colors.YELLOW}⏳ {message}...{Colors.RESET}", end='', flush=True)
-        time.sleep(delay)
-        print(f" {Colors.GREEN}Done{Colors.RESET}")
+    @contextlib.contextmanager
+    def _progress(self, message: str) -> Iterator[None]:
+        """
+        Show a progress indicator while the wrapped block runs.
+
+        On a terminal a spinner turns until the block finishes; otherwise
+        only the message and a final 'Done' are printed.
+
+        Args:
+            message: What is in progress
+        """
+        import threading
+
+        print(f"{Colors.YELLOW}⏳ {message}...{Colors.RESET} ", end='', flush=True)
+        stop = threading.Event()
+
+        def spin():
+            frames = '|/-\\'
+            i = 0
+            while not stop.wait(0.08):
+                print(f"{frames[i % len(frames)]}\b", end='', flush=True)
+                i += 1
+
+        spinner = threading.Thread(target=spin, daemon=True) if sys.stdout.isatty() else None
+        if spinner:
+            spinner.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            if spinner:
+                spinner.join()
+            print(f"{Colors.GREEN}Done{Colors.RESET}")
 
     def _ask_yes_no(self, question: str, default: bool = True) -> bool:
         """
@@ -191,6 +455,22 @@ class PatternHunterCLI:
             return default
 
         suffix = " [Y/n]" if default else " [y/N]"
+
+        # On a terminal, answer with a single keypress (no Enter needed)
+        if termios is not None and sys.stdin.isatty():
+            while True:
+                print(f"{Colors.YELLOW}{question}{suffix}: {Colors.RESET}", end='', flush=True)
+                key = self._getch().lower()
+                print(key if key.isprintable() else '')
+
+                if key in ('\r', '\n'):
+                    return default
+                if key == 'y':
+                    return True
+                if key == 'n':
+                    return False
+                print(f"{Colors.RED}Please answer 'y' or 'n'{Colors.RESET}")
+
         while True:
             response = input(f"{Colors.YELLOW}{question}{suffix}: {Colors.RESET}").strip().lower()
 
@@ -204,6 +484,21 @@ class PatternHunterCLI:
             else:
                 print(f"{Colors.RED}Please answer 'y' or 'n'{Colors.RESET}")
 
+    def _getch(self) -> str:
+        """
+        Read one keypress from the terminal without waiting for Enter.
+
+        Returns:
+            The character typed
+        """
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            return sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
     def _ask_choice(self, question: str, choices: List[str]) -> Optional[str]:
         """
         Ask user to choose from a list.
@@ -265,9 +560,20 @@ class PatternHunterCLI:
         if self.auto:
             self._print_warning("AUTO MODE - All prompts will be auto-approved")
 
+        # Same commit, options and agent memory as a recent hunt: its results still stand
+        hunt_inputs = self._hunt_inputs(args)
+        if (
+            not args.force
+            and hunt_inputs is not None
+            and hunt_inputs == self.state.get('last_hunt_inputs')
+            and self._last_run_recent()
+        ):
+            self._print_info("Nothing changed since last hunt (use --force to hunt anyway)")
+            return 0
+
         # Step 1: Collect signals
         self._print_subheader("Step 1: Collecting Signals")
-        signals_file = self.state_dir / f'signals-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        signals_file = self.state_dir / f'signals-{self.run_tag}.json'
 
         result = self._run_collect(signals_file, args.days)
         if result != 0:
@@ -279,7 +585,7 @@ class PatternHunterCLI:
 
         # Step 2: Analyze patterns
         self._print_subheader("Step 2: Analyzing Patterns")
-        patterns_file = self.state_dir / f'patterns-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        patterns_file = self.state_dir / f'patterns-{self.run_tag}.json'
 
         result = self._run_analyze(signals_file, patterns_file, args.top_n)
         if result != 0:
@@ -292,25 +598,14 @@ class PatternHunterCLI:
         # In dry-run mode, create mock patterns for testing
         if self.dry_run:
             self._print_info("Dry-run mode: Using mock patterns")
-            patterns = [
-                {
-                    'name': 'Mock Pattern 1',
-                    'description': 'This is a mock pattern for dry-run testing',
-                    'evidence': ['file1.py', 'file2.py'],
-                    'frequency': 'weekly',
-                    'impact': 'high',
-                    'root_cause': 'Mock root cause'
-                }
-            ]
+            patterns = list(_MOCK_PATTERNS)
         else:
             # Load patterns for review
-            with open(patterns_file) as f:
-                patterns_data = json.load(f)
-
-            patterns = patterns_data.get('patterns', [])
+            patterns = _load_items(patterns_file, 'patterns')
 
         if not patterns:
             self._print_warning("No patterns identified. Hunt complete.")
+            self._record_hunt(hunt_inputs)
             return 0
 
         # Step 3: Review patterns interactively
@@ -321,6 +616,7 @@ class PatternHunterCLI:
 
         if not patterns_to_process:
             self._print_warning("No patterns selected for processing")
+            self._record_hunt(hunt_inputs)
             return 0
 
         # Step 4: Generate defeat tests
@@ -333,7 +629,7 @@ class PatternHunterCLI:
 
         # Step 5: Generate proposals
         self._print_subheader("Step 5: Generating Agent Updates")
-        proposals_file = self.state_dir / f'proposals-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        proposals_file = self.state_dir / f'proposals-{self.run_tag}.json'
 
         result = self._run_propose_updates(patterns_to_process, proposals_file)
         if result != 0:
@@ -353,10 +649,71 @@ class PatternHunterCLI:
         self._print_success(f"Processed {len(patterns_to_process)} patterns")
         self._print_info(f"Results saved in: {self.state_dir}")
 
+        self._record_hunt(hunt_inputs)
+
+        return 0
+
+    def _record_hunt(self, hunt_inputs: Optional[Dict[str, Any]]):
+        """Remember when a completed hunt ran and, unless a dry run, what it covered."""
         self.state['last_run'] = datetime.now().isoformat()
+        if not self.dry_run:
+            self.state['last_hunt_inputs'] = hunt_inputs
         self._save_state()
 
-        return 0
+    def _hunt_inputs(self, args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+        """
+        Describe everything a hunt's results depend on.
+
+        Args:
+            args: Parsed hunt arguments
+
+        Returns:
+            HEAD commit, --days, --top-n and agent memory mtime, or None if
+            HEAD cannot be determined
+        """
+        head_sha = self._git_head()
+        if head_sha is None:
+            return None
+
+        try:
+            memory_mtime = AGENT_MEMORY_PATH.stat().st_mtime
+        except OSError:
+            memory_mtime = None
+
+        return {
+            'head_sha': head_sha,
+            'days': args.days,
+            'top_n': args.top_n,
+            'memory_mtime': memory_mtime
+        }
+
+    def _last_run_recent(self) -> bool:
+        """Whether the last completed hunt finished within HUNT_SKIP_MAX_AGE."""
+        try:
+            last_run = datetime.fromisoformat(self.state.get('last_run') or '')
+        except ValueError:
+            return False
+        return datetime.now() - last_run < HUNT_SKIP_MAX_AGE
+
+    def _git_head(self) -> Optional[str]:
+        """
+        Get the repository's current HEAD commit.
+
+        Returns:
+            Commit SHA, or None if it cannot be determined
+        """
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(self.repo_path), 'rev-parse', 'HEAD'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
 
     def _review_patterns(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -371,15 +728,19 @@ class PatternHunterCLI:
         selected = []
 
         for i, pattern in enumerate(patterns, 1):
-            print(f"\n{Colors.BOLD}Pattern {i}/{len(patterns)}: {pattern['name']}{Colors.RESET}")
-            print(f"{Colors.DIM}Description:{Colors.RESET} {pattern['description']}")
-            print(f"{Colors.DIM}Frequency:{Colors.RESET} {pattern['frequency']}")
-            print(f"{Colors.DIM}Impact:{Colors.RESET} {pattern['impact']}")
-            print(f"{Colors.DIM}Evidence:{Colors.RESET}")
-            for evidence in pattern.get('evidence', [])[:3]:  # Show first 3
-                print(f"  • {evidence}")
-            if len(pattern.get('evidence', [])) > 3:
-                print(f"  {Colors.DIM}... and {len(pattern['evidence']) - 3} more{Colors.RESET}")
+            # Build the whole summary and print it in one write
+            lines = [
+                f"\n{Colors.BOLD}Pattern {i}/{len(patterns)}: {pattern['name']}{Colors.RESET}",
+                f"{Colors.DIM}Description:{Colors.RESET} {pattern['description']}",
+                f"{Colors.DIM}Frequency:{Colors.RESET} {pattern['frequency']}",
+                f"{Colors.DIM}Impact:{Colors.RESET} {pattern['impact']}",
+                f"{Colors.DIM}Evidence:{Colors.RESET}"
+            ]
+            evidence = pattern.get('evidence', [])
+            lines.extend(f"  • {item}" for item in evidence[:3])  # Show first 3
+            if len(evidence) > 3:
+                lines.append(f"  {Colors.DIM}... and {len(evidence) - 3} more{Colors.RESET}")
+            print('\n'.join(lines))
 
             if self._ask_yes_no("Process this pattern?", default=True):
                 selected.append(pattern)
@@ -401,20 +762,9 @@ class PatternHunterCLI:
         """
         # In dry-run mode, create mock proposals
         if self.dry_run:
-            proposals = [
-                {
-                    'agent': 'Dev-Backend',
-                    'pattern_name': 'Mock Pattern 1',
-                    'non_negotiable': '- [ ] NEVER use mock patterns',
-                    'discipline': 'Always validate before using',
-                    'memory': 'Learned: Mock patterns are for testing',
-                    'memory_tags': ['anti-patterns', 'mock']
-                }
-            ]
+            proposals = list(_MOCK_PROPOSALS)
         else:
-            with open(proposals_file) as f:
-                proposals_data = json.load(f)
-            proposals = proposals_data.get('proposals', [])
+            proposals = _load_items(proposals_file, 'proposals')
 
         if not proposals:
             self._print_warning("No proposals generated")
@@ -425,25 +775,40 @@ class PatternHunterCLI:
         for proposal in proposals:
             print(f"  • {proposal['agent']}: {proposal['pattern_name']}")
 
-        # Ask about pre-commit hooks
-        if self._ask_yes_no("\nUpdate pre-commit hooks with defeat tests?", default=True):
-            result = self._run_update_precommit()
-            if result != 0:
-                self._print_error("Pre-commit update failed")
-                return result
-
-        # Ask about agent memory
-        if self._ask_yes_no("Update agent memory with learnings?", default=True):
-            # In dry-run mode, pass mock data instead of file
-            if self.dry_run:
-                result = self._run_update_memory_mock(proposals)
-            else:
-                result = self._run_update_memory(proposals_file)
+        # Ask about both updates up front so they can run together
+        update_precommit = self._ask_yes_no("\nUpdate pre-commit hooks with defeat tests?", default=True)
+        update_memory = self._ask_yes_no("Update agent memory with learnings?", default=True)
 
+        if update_precommit and update_memory and not self.dry_run:
+            # The two updates touch different files, so run them side by side
+            result = self._run_stages_concurrently([
+                ('update_precommit', self._update_precommit_argv(), "Pre-commit update failed", None),
+                ('update_memory', self._update_memory_argv(proposals_file), "Memory update failed", None)
+            ])
             if result != 0:
-                self._print_error("Memory update failed")
+                self._print_error("Agent updates failed")
                 return result
 
+            self._print_success("Pre-commit hooks updated")
+            self._print_success("Agent memory updated")
+        else:
+            if update_precommit:
+                result = self._run_update_precommit()
+                if result != 0:
+                    self._print_error("Pre-commit update failed")
+                    return result
+
+            if update_memory:
+                # In dry-run mode, pass mock data instead of file
+                if self.dry_run:
+                    result = self._run_update_memory_mock(proposals)
+                else:
+                    result = self._run_update_memory(proposals_file)
+
+                if result != 0:
+                    self._print_error("Memory update failed")
+                    return result
+
         # Show proposal file location (if not dry-run)
         if not self.dry_run:
             self._print_info(f"Review full proposals at: {proposals_file}")
@@ -456,7 +821,7 @@ class PatternHunterCLI:
         """Collect signals from git, memory, and code churn."""
         self._print_header("📊 Collecting Pattern Signals")
 
-        output_file = Path(args.output) if args.output else self.state_dir / f'signals-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        output_file = Path(args.output) if args.output else self.state_dir / f'signals-{self.run_tag}.json'
 
         result = self._run_collect(output_file, args.days)
 
@@ -481,7 +846,7 @@ class PatternHunterCLI:
             self._print_error(f"Input file not found: {input_file}")
             return 1
 
-        output_file = Path(args.output) if args.output else self.state_dir / f'patterns-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        output_file = Path(args.output) if args.output else self.state_dir / f'patterns-{self.run_tag}.json'
 
         result = self._run_analyze(input_file, output_file, args.top_n)
 
@@ -507,10 +872,7 @@ class PatternHunterCLI:
             return 1
 
         # Load patterns
-        with open(input_file) as f:
-            patterns_data = json.load(f)
-
-        patterns = patterns_data.get('patterns', [])
+        patterns = _load_items(input_file, 'patterns')
 
         # Filter by pattern name if specified
         if args.pattern:
@@ -543,56 +905,213 @@ class PatternHunterCLI:
 
     # Helper methods that call actual implementation modules
 
+    def _stage_command(self, name: str, argv: List[str]) -> List[str]:
+        """Build the equivalent command line for running a stage script."""
+        return [sys.executable, STAGE_SCRIPTS[name]] + argv
+
+    def _run_stage(
+        self,
+        name: str,
+        argv: List[str],
+        failure: str,
+        input_data: Optional[str] = None
+    ) -> int:
+        """
+        Run a stage script's main() and show its output.
+
+        Stages run in-process by default, reusing this interpreter and any
+        modules it has already imported. With --isolate each stage runs as a
+        separate Python subprocess instead.
+
+        Args:
+            name: Script name without the .py suffix (e.g. 'collect')
+            argv: Arguments for the script
+            failure: Error message prefix if the stage fails
+            input_data: Text to feed the stage on stdin
+
+        Returns:
+            The stage's exit code
+        """
+        if self.isolate:
+            returncode, errors = self._run_streamed(self._stage_command(name, argv), input_data)
+        else:
+            # Show stdout line by line as the stage writes it; keep stderr for errors.
+            # Each stream has a binary .buffer, as it would in a subprocess
+            console = sys.stdout
+            stdout = _text_stream(_LineWriter(lambda line: self._print_dim(line, file=console)))
+            stderr_bytes = io.BytesIO()
+            stderr = _text_stream(stderr_bytes)
+            saved_stdin = sys.stdin
+            if input_data is not None:
+                sys.stdin = _text_stream(io.BytesIO(input_data.encode('utf-8')))
+            try:
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    returncode = _load_stage(name).main(argv)
+            except SystemExit as e:
+                # argparse errors and explicit sys.exit() calls
+                returncode = e.code if isinstance(e.code, int) or e.code is None else 1
+            except Exception as e:
+                stderr.write(f"{e}\n")
+                returncode = 1
+            finally:
+                sys.stdin = saved_stdin
+                stdout.close()
+            errors = stderr_bytes.getvalue().decode('utf-8', errors='replace')
+
+        if returncode:
+            self._print_error(f"{failure}: {errors}")
+            return returncode
+
+        return 0
+
+    def _run_streamed(self, cmd: List[str], input_data: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Run a command, printing its stdout as lines arrive.
+
+        stderr is drained (and stdin fed) on helper threads so a full pipe
+        cannot stall the child while stdout is being read.
+
+        Args:
+            cmd: Command to run
+            input_data: Text to feed the command on stdin
+
+        Returns:
+            Tuple of (exit code, stderr)
+        """
+        # Only --isolate needs these; in-process runs skip the imports
+        import subprocess
+        import threading
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+        stderr_lines: List[str] = []
+
+        def feed_stdin():
+            try:
+                with process.stdin:
+                    process.stdin.write(input_data)
+            except BrokenPipeError:
+                pass  # Child exited without reading everything
+
+        threads = [threading.Thread(target=lambda: stderr_lines.extend(process.stderr))]
+        if input_data is not None:
+            threads.append(threading.Thread(target=feed_stdin))
+        for thread in threads:
+            thread.start()
+
+        for line in process.stdout:
+            self._print_dim(line.rstrip('\n'))
+
+        for thread in threads:
+            thread.join()
+        return process.wait(), ''.join(stderr_lines)
+
+    async def _run_stage_async(
+        self,
+        name: str,
+        argv: List[str],
+        input_data: Optional[str] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Run a stage script as a subprocess without blocking other stages.
+
+        Args:
+            name: Script name without the .py suffix
+            argv: Arguments for the script
+            input_data: Text to feed the stage on stdin
+
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+        """
+        import asyncio
+
+        process = await asyncio.create_subprocess_exec(
+            *self._stage_command(name, argv),
+            stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate(
+            input_data.encode() if input_data is not None else None
+        )
+        return process.returncode, stdout.decode(), stderr.decode()
+
+    def _run_stages_concurrently(
+        self,
+        stages: List[Tuple[str, List[str], str, Optional[str]]]
+    ) -> int:
+        """
+        Run independent stages at the same time.
+
+        Each stage gets its own subprocess, even without --isolate: in-process
+        stages capture output by redirecting this process's stdout, which
+        cannot be shared. Output is shown per stage once all have finished.
+
+        Args:
+            stages: (script name, arguments, failure message, stdin text) for
+                each stage
+
+        Returns:
+            0 if every stage succeeded, otherwise the first non-zero exit code
+        """
+        # asyncio is slow to import and only needed when stages run concurrently
+        import asyncio
+
+        async def run_all() -> List[Tuple[int, str, str]]:
+            return await asyncio.gather(
+                *(self._run_stage_async(name, argv, input_data)
+                  for name, argv, _, input_data in stages)
+            )
+
+        with self._progress(f"Running {len(stages)} stages in parallel"):
+            results = asyncio.run(run_all())
+
+        status = 0
+        for (_, _, failure, _), (returncode, stdout, stderr) in zip(stages, results):
+            if returncode:
+                self._print_error(f"{failure}: {stderr}")
+                status = status or returncode
+            else:
+                self._print_dim(stdout)
+        return status
+
     def _run_collect(self, output_file: Path, days: int) -> int:
         """Run collect.py module."""
-        script = Path(__file__).parent / 'collect.py'
-        cmd = [
-            sys.executable,
-            str(script),
+        argv = [
             '--repo-path', str(self.repo_path),
             '--days', str(days),
             '--output', str(output_file)
         ]
 
         if self.dry_run:
-            self._print_dim(f"Would run: {' '.join(cmd)}")
+            self._print_dim(f"Would run: {' '.join(self._stage_command('collect', argv))}")
             return 0
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Collection failed: {e.stderr}")
-            return e.returncode
+        return self._run_stage('collect', argv, "Collection failed")
 
     def _run_analyze(self, input_file: Path, output_file: Path, top_n: int) -> int:
         """Run analyze.py module."""
-        script = Path(__file__).parent / 'analyze.py'
-        cmd = [
-            sys.executable,
-            str(script),
+        argv = [
             '--input', str(input_file),
             '--output', str(output_file),
             '--top-n', str(top_n)
         ]
 
         if self.dry_run:
-            self._print_dim(f"Would run: {' '.join(cmd)}")
+            self._print_dim(f"Would run: {' '.join(self._stage_command('analyze', argv))}")
             return 0
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Analysis failed: {e.stderr}")
-            return e.returncode
+        return self._run_stage('analyze', argv, "Analysis failed")
 
     def _run_generate_tests(self, patterns: List[Dict[str, Any]]) -> int:
         """Run generate_tests.py module."""
-        script = Path(__file__).parent / 'generate_tests.py'
-
         # In dry-run mode, just show what would be done
         if self.dry_run:
             self._print_dim(f"Would generate {len(patterns)} defeat tests in .sdlc/tests/patterns/")
@@ -601,34 +1120,18 @@ class PatternHunterCLI:
                 self._print_dim(f"  - test_{pattern_slug}.py")
             return 0
 
-        # Write patterns to temp file
-        temp_file = self.state_dir / 'temp_patterns.json'
-        with open(temp_file, 'w') as f:
-            json.dump({'patterns': patterns}, f, indent=2)
-
-        cmd = [
-            sys.executable,
-            str(script),
-            '--input', str(temp_file),
+        # One run: generate_tests batches patterns per Claude call and runs
+        # those calls concurrently itself
+        argv = [
+            '--input', '-',
             '--output-dir', str(self.repo_path / '.sdlc' / 'tests' / 'patterns')
         ]
-
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Test generation failed: {e.stderr}")
-            return e.returncode
-        finally:
-            # Clean up temp file
-            if temp_file.exists():
-                temp_file.unlink()
+        return self._run_stage(
+            'generate_tests', argv, "Test generation failed", _dumps({'patterns': patterns})
+        )
 
     def _run_propose_updates(self, patterns: List[Dict[str, Any]], output_file: Path) -> int:
         """Run propose_updates.py module."""
-        script = Path(__file__).parent / 'propose_updates.py'
-
         # In dry-run mode, just show what would be done
         if self.dry_run:
             self._print_dim(f"Would generate proposals for {len(patterns)} patterns")
@@ -636,72 +1139,53 @@ class PatternHunterCLI:
                 self._print_dim(f"  - {pattern['name']}: Agent prompt + memory update")
             return 0
 
-        # Write patterns to temp file
-        temp_file = self.state_dir / 'temp_patterns.json'
-        with open(temp_file, 'w') as f:
-            json.dump({'patterns': patterns}, f, indent=2)
-
-        cmd = [
-            sys.executable,
-            str(script),
-            '--input', str(temp_file),
+        argv = [
+            '--input', '-',
             '--output', str(output_file)
         ]
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Proposal generation failed: {e.stderr}")
-            return e.returncode
-        finally:
-            # Clean up temp file
-            if temp_file.exists():
-                temp_file.unlink()
+        # Patterns go over stdin rather than through a temp file
+        return self._run_stage(
+            'propose_updates', argv, "Proposal generation failed",
+            input_data=_dumps({'patterns': patterns})
+        )
 
-    def _run_update_precommit(self) -> int:
-        """Run update_precommit.py module."""
-        script = Path(__file__).parent / 'update_precommit.py'
-        cmd = [
-            sys.executable,
-            str(script),
+    def _update_precommit_argv(self) -> List[str]:
+        """Build update_precommit.py arguments."""
+        argv = [
             '--config', str(self.repo_path / '.pre-commit-config.yaml'),
             '--test-dir', str(self.repo_path / '.sdlc' / 'tests' / 'patterns')
         ]
 
         if self.dry_run:
-            cmd.append('--dry-run')
+            argv.append('--dry-run')
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
+        return argv
+
+    def _run_update_precommit(self) -> int:
+        """Run update_precommit.py module."""
+        result = self._run_stage('update_precommit', self._update_precommit_argv(), "Pre-commit update failed")
+        if result == 0:
             self._print_success("Pre-commit hooks updated")
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Pre-commit update failed: {e.stderr}")
-            return e.returncode
+        return result
 
-    def _run_update_memory(self, proposals_file: Path) -> int:
-        """Run update_memory.py module."""
-        script = Path(__file__).parent / 'update_memory.py'
-        cmd = [
-            sys.executable,
-            str(script),
+    def _update_memory_argv(self, proposals_file: Path) -> List[str]:
+        """Build update_memory.py arguments."""
+        argv = [
             '--input', str(proposals_file)
         ]
 
         if self.dry_run:
-            cmd.append('--dry-run')
+            argv.append('--dry-run')
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._print_dim(result.stdout)
+        return argv
+
+    def _run_update_memory(self, proposals_file: Path) -> int:
+        """Run update_memory.py module."""
+        result = self._run_stage('update_memory', self._update_memory_argv(proposals_file), "Memory update failed")
+        if result == 0:
             self._print_success("Agent memory updated")
-            return 0
-        except subprocess.CalledProcessError as e:
-            self._print_error(f"Memory update failed: {e.stderr}")
-            return e.returncode
+        return result
 
     def _run_update_memory_mock(self, proposals: List[Dict[str, Any]]) -> int:
         """Mock memory update for dry-run mode."""
@@ -712,8 +1196,30 @@ class PatternHunterCLI:
         return 0
 
 
-def main():
-    """Main entry point for CLI."""
+def _has_staged_changes() -> bool:
+    """
+    Check whether the current repository has staged changes.
+
+    Returns:
+        True if anything is staged, or if git could not be asked
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--cached', '--name-only'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return True
+    return bool(result.stdout.strip())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description='Pattern Hunter - Interactive pattern detection workflow',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -740,6 +1246,10 @@ Examples:
     parser.add_argument('--dry-run', action='store_true', help='Show plans without executing')
     parser.add_argument('--auto', action='store_true', help='Auto-approve all prompts')
     parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+    parser.add_argument('--isolate', action='store_true',
+                        help='Run each stage in a separate Python process instead of in-process')
+    parser.add_argument('--skip-if-no-changes', action='store_true',
+                        help='Exit immediately if nothing is staged in git (for pre-commit hooks)')
 
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
@@ -747,6 +1257,8 @@ Examples:
     hunt_parser = subparsers.add_parser('hunt', help='Run full pattern hunting workflow')
     hunt_parser.add_argument('--days', type=int, default=30, help='Days of history to analyze (default: 30)')
     hunt_parser.add_argument('--top-n', type=int, default=10, help='Max patterns to identify (default: 10)')
+    hunt_parser.add_argument('--force', action='store_true',
+                             help='Hunt even if nothing changed since a hunt in the last 24 hours')
     hunt_parser.set_defaults(days=30, top_n=10)
 
     # collect command
@@ -771,7 +1283,25 @@ Examples:
     apply_parser = subparsers.add_parser('apply', help='Apply agent updates')
     apply_parser.add_argument('--input', type=str, required=True, help='Input proposals file')
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Hook fast path: with nothing staged there is nothing to do, so exit
+    # before building the parser
+    if '--skip-if-no-changes' in argv and not _has_staged_changes():
+        return 0
+
+    args = _build_parser().parse_args(argv)
 
     # Disable colors if requested
     if args.no_color:
@@ -782,12 +1312,14 @@ Examples:
         args.command = 'hunt'
         args.days = 30
         args.top_n = 10
+        args.force = False
 
     # Create CLI instance
     cli = PatternHunterCLI(
         repo_path=args.repo_path,
         dry_run=args.dry_run,
-        auto=args.auto
+        auto=args.auto,
+        isolate=args.isolate
     )
 
     # Route to appropriate command
@@ -23,14 +23,166 @@ Output:
 """
 
 import argparse
+import copy
+import functools
+import heapq
 import json
 import os
 import re
 import subprocess
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # Optional streaming parser; whole-file parsing is the fallback
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Example commits/memories kept per signal; the rest are only counted
+MAX_EXAMPLES = 5
+
+# Parse errors from either JSON reader used for the agent memory file
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+def _since_date(days: int) -> str:
+    """Return the date (YYYY-MM-DD) a look-back of the given days starts from."""
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _git_error(error: subprocess.CalledProcessError) -> str:
+    """Describe a failed git command, including git's own error text."""
+    detail = (error.stderr or '').strip()
+    return f"{error} {detail}" if detail else str(error)
+
+
+def _count_commits_since(repo_path: Path, since_date: str, paths: Optional[List[str]] = None) -> int:
+    """
+    Count commits reachable from HEAD since a date.
+
+    Args:
+        repo_path: Path to git repository
+        since_date: Earliest commit date (YYYY-MM-DD)
+        paths: Only count commits touching these paths (default: all)
+
+    Returns:
+        Number of commits in the window
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    cmd = ['git', '-C', str(repo_path), 'rev-list', '--count', f'--since={since_date}', 'HEAD']
+    if paths:
+        cmd += ['--'] + paths
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return int(result.stdout.strip() or 0)
+
+
+def _collect_git_log(
+    repo_path: Path,
+    since_date: str,
+    paths: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read all commits since a date, with per-file line counts, in one git call.
+
+    GitHistoryAnalyzer and CodeChurnAnalyzer both work from this log, so
+    collect_all_signals runs it once and shares the result.
+
+    Args:
+        repo_path: Path to git repository
+        since_date: Earliest commit date (YYYY-MM-DD)
+        paths: Only read commits touching these paths, and only their
+            changes to them (default: all)
+
+    Returns:
+        List of commit dictionaries, newest first, with structure:
+        {
+            "hash": "commit_hash",
+            "date": "ISO-8601 datetime",
+            "author": "author_name",
+            "message": "commit subject",
+            "files": [("file.py", insertions, deletions)],
+            "insertions": N,
+            "deletions": M
+        }
+        Binary files (which have no line counts) are left out of "files"
+        and the totals.
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    # '>' marks headers (numstat lines start with a digit or '-'); then hash, ISO date, author, subject
+    log_format = '>%H%x00%aI%x00%an%x00%s'
+    cmd = [
+        'git', '-C', str(repo_path), 'log',
+        f'--since={since_date}',
+        f'--format={log_format}',
+        '--numstat',
+        '--no-renames'  # Report renames as delete + add so paths are never "old => new"
+    ]
+    if paths:
+        cmd += ['--'] + paths
+
+    # Stream the log so only the parsed commits are held, not the raw output
+    commits = []
+    current_commit = None
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if line.startswith('>'):  # Commit header line
+                parts = line[1:].split('\x00')
+                current_commit = None
+                if len(parts) >= 4:
+                    current_commit = {
+                        'hash': parts[0],
+                        'date': parts[1],
+                        'author': sys.intern(parts[2]),
+                        'message': parts[3],
+                        'files': [],
+                        'insertions': 0,
+                        'deletions': 0
+                    }
+                    commits.append(current_commit)
+            elif line and current_commit:  # Stats line
+                parts = line.split('\t')
+                if len(parts) >= 3:
+                    insertions, deletions, filename = parts[0], parts[1], parts[2]
+
+                    # Skip binary files (git reports '-' for both counts, never just one)
+                    if insertions != '-':
+                        insertions, deletions = int(insertions), int(deletions)
+                        # Intern: the same paths recur across commits and key every grouping
+                        current_commit['files'].append((sys.intern(filename), insertions, deletions))
+                        current_commit['insertions'] += insertions
+                        current_commit['deletions'] += deletions
+
+        # Read after stdout is drained; git writes little to stderr, so it cannot fill the pipe first
+        stderr = proc.stderr.read()
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+    return commits
 
 
 class GitHistoryAnalyzer:
@@ -51,39 +203,31 @@ class GitHistoryAnalyzer:
         r'\bwhoops\b',
     ]
 
-    def __init__(self, repo_path: str, days: int = 30):
+    # All fix patterns as one compiled alternation, matched once per commit
+    _FIX_RE = re.compile('|'.join(f'(?:{p})' for p in FIX_PATTERNS), re.IGNORECASE)
+
+    def __init__(
+        self,
+        repo_path: str,
+        days: int = 30,
+        since_date: Optional[str] = None,
+        resolved_repo: Optional[Path] = None,
+        paths: Optional[List[str]] = None
+    ):
         """
         Initialize git history analyzer.
 
         Args:
             repo_path: Path to git repository
             days: Number of days to look back in history
+            since_date: Precomputed start date (default: derived from days)
+            resolved_repo: Precomputed resolved repo_path (default: resolve it)
+            paths: Limit the history to these paths (default: whole repo)
         """
-        self.repo_path = Path(repo_path).resolve()
+        self.repo_path = resolved_repo or Path(repo_path).resolve()
         self.days = days
-        self.since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-
-    def _run_git_command(self, args: List[str]) -> str:
-        """
-        Run a git command and return output.
-
-        Args:
-            args: Git command arguments
-
-        Returns:
-            Command output as string
-
-        Raises:
-            subprocess.CalledProcessError: If git command fails
-        """
-        cmd = ['git', '-C', str(self.repo_path)] + args
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
+        self.since_date = since_date or _since_date(days)
+        self.paths = paths
 
     def _is_fix_commit(self, message: str) -> bool:
         """
@@ -95,16 +239,15 @@ class GitHistoryAnalyzer:
         Returns:
             True if message contains fix-related keywords
         """
-        message_lower = message.lower()
-        return any(
-            re.search(pattern, message_lower, re.IGNORECASE)
-            for pattern in self.FIX_PATTERNS
-        )
+        return self._FIX_RE.search(message) is not None
 
-    def analyze(self) -> List[Dict[str, Any]]:
+    def analyze(self, log_records: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Analyze git history for fix commits and patterns.
 
+        Args:
+            log_records: Commits from _collect_git_log (default: read the log)
+
         Returns:
             List of signal dictionaries with structure:
             {
@@ -117,81 +260,49 @@ class GitHistoryAnalyzer:
                 "stats": {"insertions": N, "deletions": M}
             }
         """
-        signals = []
-
         try:
-            # Get all commits in the time period with stats
-            log_format = '%H%x00%aI%x00%an%x00%s'  # hash, ISO date, author, subject
-            log_output = self._run_git_command([
-                'log',
-                f'--since={self.since_date}',
-                f'--format={log_format}',
-                '--numstat'
-            ])
-
-            if not log_output:
-                return signals
-
-            # Parse commits
-            current_commit = None
-            for line in log_output.split('\n'):
-                if '\x00' in line:  # Commit header line
-                    if current_commit:
-                        signals.append(current_commit)
-
-                    parts = line.split('\x00')
-                    if len(parts) >= 4:
-                        commit_hash, date, author, message = parts[0], parts[1], parts[2], parts[3]
-
-                        current_commit = {
-                            'type': 'fix_commit' if self._is_fix_commit(message) else 'commit',
-                            'hash': commit_hash,
-                            'date': date,
-                            'author': author,
-                            'message': message,
-                            'files_changed': [],
-                            'stats': {'insertions': 0, 'deletions': 0}
-                        }
-                elif line and current_commit:  # Stats line
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        insertions, deletions, filename = parts[0], parts[1], parts[2]
-
-                        # Skip binary files
-                        if insertions != '-' and deletions != '-':
-                            current_commit['files_changed'].append(filename)
-                            current_commit['stats']['insertions'] += int(insertions)
-                            current_commit['stats']['deletions'] += int(deletions)
-
-            # Add last commit
-            if current_commit:
-                signals.append(current_commit)
+            if log_records is None:
+                log_records = _collect_git_log(self.repo_path, self.since_date, self.paths)
+
+            signals = [
+                {
+                    'type': 'fix_commit' if self._is_fix_commit(commit['message']) else 'commit',
+                    'hash': commit['hash'],
+                    'date': commit['date'],
+                    'author': commit['author'],
+                    'message': commit['message'],
+                    'files_changed': [filename for filename, _, _ in commit['files']],
+                    'stats': {'insertions': commit['insertions'], 'deletions': commit['deletions']}
+                }
+                for commit in log_records
+            ]
 
             # Filter to only fix commits
             fix_signals = [s for s in signals if s['type'] == 'fix_commit']
 
             # Analyze file modification frequency
-            file_modification_count: Dict[str, List[Dict]] = {}
+            file_modification_count: Counter = Counter()
+            file_modifications: Dict[str, List[Dict]] = defaultdict(list)
             for signal in signals:
                 for filepath in signal['files_changed']:
-                    if filepath not in file_modification_count:
-                        file_modification_count[filepath] = []
-                    file_modification_count[filepath].append({
-                        'hash': signal['hash'],
-                        'date': signal['date'],
-                        'message': signal['message']
-                    })
+                    file_modification_count[filepath] += 1
+                    if file_modification_count[filepath] <= MAX_EXAMPLES:
+                        file_modifications[filepath].append({
+                            'hash': signal['hash'],
+                            'date': signal['date'],
+                            'message': signal['message']
+                        })
 
             # Add repeated modification signals for files changed 3+ times
             repeated_signals = []
-            for filepath, modifications in file_modification_count.items():
-                if len(modifications) >= 3:
+            for filepath, count in file_modification_count.items():
+                if count >= 3:
                     repeated_signals.append({
                         'type': 'repeated_modification',
                         'file': filepath,
-                        'modification_count': len(modifications),
-                        'modifications': modifications[:5],  # Keep first 5
-                        'signal_strength': 'high' if len(modifications) >= 5 else 'medium'
+                        'modification_count': count,
+                        'modifications': file_modifications[filepath],
+                        'signal_strength': 'high' if count >= 5 else 'medium'
                     })
 
             # Sort by modification count (descending)
@@ -200,7 +311,7 @@ class GitHistoryAnalyzer:
             return fix_signals + repeated_signals
 
         except subprocess.CalledProcessError as e:
-            print(f"Warning: Git command failed: {e}", file=sys.stderr)
+            print(f"Warning: Git command failed: {_git_error(e)}", file=sys.stderr)
             return []
         except Exception as e:
             print(f"Warning: Error analyzing git history: {e}", file=sys.stderr)
@@ -243,71 +354,89 @@ class AgentMemoryAnalyzer:
                 print(f"Info: Agent memory file not found at {self.memory_path}", file=sys.stderr)
                 return signals
 
-            with open(self.memory_path, 'r') as f:
-                memories = json.load(f)
-
-            if not isinstance(memories, list):
-                print("Warning: Agent memory file has unexpected format", file=sys.stderr)
-                return signals
-
             # Group memories by category and tags
-            category_groups: Dict[str, List[Dict]] = {}
-            tag_groups: Dict[str, List[Dict]] = {}
-
-            for memory in memories:
-                if not isinstance(memory, dict):
-                    continue
-
-                # Group by category
-                category = memory.get('category', 'unknown')
-                if category not in category_groups:
-                    category_groups[category] = []
-                category_groups[category].append(memory)
-
-                # Group by tags
-                tags = memory.get('tags', [])
-                if isinstance(tags, list):
-                    for tag in tags:
-                        if tag not in tag_groups:
-                            tag_groups[tag] = []
-                        tag_groups[tag].append(memory)
+            category_counts: Counter = Counter()
+            tag_counts: Counter = Counter()
+            category_groups: Dict[str, List[Dict]] = defaultdict(list)
+            tag_groups: Dict[str, List[Dict]] = defaultdict(list)
+
+            with open(self.memory_path, 'rb') as f:
+                # Stream top-level arrays with ijson; anything else is parsed whole
+                first_byte = f.read(1)
+                while first_byte.isspace():
+                    first_byte = f.read(1)
+                f.seek(0)
+
+                if ijson is not None and first_byte == b'[':
+                    memories = ijson.items(f, 'item', use_float=True)
+                else:
+                    memories = _loads(f.read())
+                    if not isinstance(memories, list):
+                        print("Warning: Agent memory file has unexpected format", file=sys.stderr)
+                        return signals
+
+                for memory in memories:
+                    if not isinstance(memory, dict):
+                        continue
+
+                    # Keep only the fields reported in signals, with content truncated
+                    category = memory.get('category', 'unknown')
+                    tags = memory.get('tags', [])
+                    entry = {
+                        'timestamp': memory.get('timestamp'),
+                        'content': memory.get('content', '')[:200],
+                        'tags': tags,
+                        'category': memory.get('category')
+                    }
+
+                    # Group by category
+                    category_counts[category] += 1
+                    if category_counts[category] <= MAX_EXAMPLES:
+                        category_groups[category].append(entry)
+
+                    # Group by tags
+                    if isinstance(tags, list):
+                        for tag in tags:
+                            tag_counts[tag] += 1
+                            if tag_counts[tag] <= MAX_EXAMPLES:
+                                tag_groups[tag].append(entry)
 
             # Identify repeated patterns (categories with 3+ memories)
-            for category, mems in category_groups.items():
-                if len(mems) >= 3:
+            for category, count in category_counts.items():
+                if count >= 3:
                     signals.append({
                         'type': 'repeated_learning',
                         'pattern': f'Multiple learnings in category: {category}',
                         'category': category,
-                        'occurrences': len(mems),
+                        'occurrences': count,
                         'memories': [
                             {
-                                'timestamp': m.get('timestamp'),
-                                'content': m.get('content', '')[:200],  # Truncate
-                                'tags': m.get('tags', [])
+                                'timestamp': m['timestamp'],
+                                'content': m['content'],
+                                'tags': m['tags']
                             }
-                            for m in mems[:5]  # Keep first 5
+                            for m in category_groups[category]
                         ],
-                        'signal_strength': 'high' if len(mems) >= 5 else 'medium'
+                        'signal_strength': 'high' if count >= 5 else 'medium'
                     })
 
             # Identify repeated patterns (tags with 3+ memories)
-            for tag, mems in tag_groups.items():
-                if len(mems) >= 3:
+            for tag, count in tag_counts.items():
+                if count >= 3:
                     signals.append({
                         'type': 'repeated_learning',
                         'pattern': f'Multiple learnings with tag: {tag}',
                         'tag': tag,
-                        'occurrences': len(mems),
+                        'occurrences': count,
                         'memories': [
                             {
-                                'timestamp': m.get('timestamp'),
-                                'content': m.get('content', '')[:200],  # Truncate
-                                'category': m.get('category')
+                                'timestamp': m['timestamp'],
+                                'content': m['content'],
+                                'category': m['category']
                             }
-                            for m in mems[:5]  # Keep first 5
+                            for m in tag_groups[tag]
                         ],
-                        'signal_strength': 'high' if len(mems) >= 5 else 'medium'
+                        'signal_strength': 'high' if count >= 5 else 'medium'
                     })
 
             # Sort by occurrences (descending)
@@ -315,7 +444,7 @@ class AgentMemoryAnalyzer:
 
             return signals
 
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             print(f"Warning: Failed to parse agent memory JSON: {e}", file=sys.stderr)
             return []
         except Exception as e:
@@ -326,7 +455,15 @@ class AgentMemoryAnalyzer:
 class CodeChurnAnalyzer:
     """Analyzes code churn to identify hot files."""
 
-    def __init__(self, repo_path: str, days: int = 30, top_n: int = 10):
+    def __init__(
+        self,
+        repo_path: str,
+        days: int = 30,
+        top_n: int = 10,
+        since_date: Optional[str] = None,
+        resolved_repo: Optional[Path] = None,
+        paths: Optional[List[str]] = None
+    ):
         """
         Initialize code churn analyzer.
 
@@ -334,27 +471,23 @@ class CodeChurnAnalyzer:
             repo_path: Path to git repository
             days: Number of days to look back
             top_n: Number of top hot files to return
+            since_date: Precomputed start date (default: derived from days)
+            resolved_repo: Precomputed resolved repo_path (default: resolve it)
+            paths: Limit the history to these paths (default: whole repo)
         """
-        self.repo_path = Path(repo_path).resolve()
+        self.repo_path = resolved_repo or Path(repo_path).resolve()
         self.days = days
         self.top_n = top_n
-        self.since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-
-    def _run_git_command(self, args: List[str]) -> str:
-        """Run a git command and return output."""
-        cmd = ['git', '-C', str(self.repo_path)] + args
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
+        self.since_date = since_date or _since_date(days)
+        self.paths = paths
 
-    def analyze(self) -> List[Dict[str, Any]]:
+    def analyze(self, log_records: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Analyze code churn to find hot files.
 
+        Args:
+            log_records: Commits from _collect_git_log (default: read the log)
+
         Returns:
             List of signal dictionaries with structure:
             {
@@ -370,49 +503,30 @@ class CodeChurnAnalyzer:
         signals = []
 
         try:
-            # Get file change statistics
-            log_output = self._run_git_command([
-                'log',
-                f'--since={self.since_date}',
-                '--format=%H%x00%aI%x00%s',
-                '--numstat'
-            ])
-
-            if not log_output:
-                return signals
-
-            # Parse file statistics
-            file_stats: Dict[str, Dict[str, Any]] = {}
-            current_commit = None
-
-            for line in log_output.split('\n'):
-                if '\x00' in line:  # Commit header
-                    parts = line.split('\x00')
-                    if len(parts) >= 3:
-                        current_commit = {
-                            'hash': parts[0],
-                            'date': parts[1],
-                            'message': parts[2]
-                        }
-                elif line and current_commit:  # Stats line
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        insertions, deletions, filename = parts[0], parts[1], parts[2]
-
-                        # Skip binary files
-                        if insertions != '-' and deletions != '-':
-                            if filename not in file_stats:
-                                file_stats[filename] = {
-                                    'commit_count': 0,
-                                    'total_insertions': 0,
-                                    'total_deletions': 0,
-                                    'commits': []
-                                }
-
-                            file_stats[filename]['commit_count'] += 1
-                            file_stats[filename]['total_insertions'] += int(insertions)
-                            file_stats[filename]['total_deletions'] += int(deletions)
-                            file_stats[filename]['commits'].append(current_commit)
+            if log_records is None:
+                log_records = _collect_git_log(self.repo_path, self.since_date, self.paths)
+
+            # Aggregate file statistics
+            file_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+                'commit_count': 0,
+                'total_insertions': 0,
+                'total_deletions': 0,
+                'commits': []
+            })
+
+            for commit in log_records:
+                commit_info = {
+                    'hash': commit['hash'],
+                    'date': commit['date'],
+                    'message': commit['message']
+                }
+                for filename, insertions, deletions in commit['files']:
+                    stats = file_stats[filename]
+                    stats['commit_count'] += 1
+                    stats['total_insertions'] += insertions
+                    stats['total_deletions'] += deletions
+                    if stats['commit_count'] <= MAX_EXAMPLES:
+                        stats['commits'].append(commit_info)
 
             # Calculate churn scores and create signals
             for filename, stats in file_stats.items():
@@ -435,73 +549,91 @@ class CodeChurnAnalyzer:
                     'total_changes': total_changes,
                     'insertions': stats['total_insertions'],
                     'deletions': stats['total_deletions'],
-                    'recent_commits': stats['commits'][:5],  # Keep first 5
+                    'recent_commits': stats['commits'],
                     'signal_strength': strength
                 })
 
-            # Sort by churn score and return top N
-            signals.sort(key=lambda x: x['churn_score'], reverse=True)
-            return signals[:self.top_n]
+            # Return top N by churn score (same order as a stable descending sort)
+            return heapq.nlargest(self.top_n, signals, key=lambda x: x['churn_score'])
 
         except subprocess.CalledProcessError as e:
-            print(f"Warning: Git command failed: {e}", file=sys.stderr)
+            print(f"Warning: Git command failed: {_git_error(e)}", file=sys.stderr)
             return []
         except Exception as e:
             print(f"Warning: Error analyzing code churn: {e}", file=sys.stderr)
             return []
 
 
-def collect_all_signals(
-    repo_path: str,
-    days: int = 30,
-    memory_path: Optional[str] = None,
-    top_n_hot_files: int = 10
+def _git_head(repo_path: Path) -> Optional[str]:
+    """Return the HEAD commit SHA, or None if it cannot be read."""
+    result = subprocess.run(
+        ['git', '-C', str(repo_path), 'rev-parse', 'HEAD'],
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _collect_signals(
+    resolved_repo: Path,
+    since_date: str,
+    days: int,
+    memory_path: Optional[str],
+    top_n_hot_files: int,
+    paths: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
-    Collect all pattern signals from git history, agent memory, and code churn.
+    Run all three analyzers and compile their signals (without a timestamp).
 
     Args:
-        repo_path: Path to git repository
+        resolved_repo: Resolved path to git repository
+        since_date: Earliest commit date (YYYY-MM-DD)
         days: Number of days to look back in history
         memory_path: Path to agent memory file (optional)
         top_n_hot_files: Number of hot files to include
+        paths: Limit git history and churn to these paths (optional)
 
     Returns:
-        Dictionary with structure:
-        {
-            "timestamp": "ISO-8601 datetime",
-            "repo_path": "/path/to/repo",
-            "collection_period_days": 30,
-            "git_signals": [...],
-            "memory_signals": [...],
-            "churn_signals": [...]
-        }
+        Results dictionary as returned by collect_all_signals, minus "timestamp"
     """
-    print(f"Collecting pattern signals from {repo_path}...", file=sys.stderr)
-    print(f"Looking back {days} days", file=sys.stderr)
+    repo_path = str(resolved_repo)
 
     # Initialize analyzers
-    git_analyzer = GitHistoryAnalyzer(repo_path, days)
+    git_analyzer = GitHistoryAnalyzer(repo_path, days, since_date, resolved_repo, paths)
     memory_analyzer = AgentMemoryAnalyzer(memory_path)
-    churn_analyzer = CodeChurnAnalyzer(repo_path, days, top_n_hot_files)
+    churn_analyzer = CodeChurnAnalyzer(repo_path, days, top_n_hot_files, since_date, resolved_repo, paths)
+
+    # Agent memory is independent of git, so read it while git log runs
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        memory_future = executor.submit(memory_analyzer.analyze)
+
+        # Read the git log once for both git-based analyzers, skipping the
+        # numstat pass entirely when the window has no commits
+        try:
+            if _count_commits_since(resolved_repo, since_date, paths) == 0:
+                git_log = []
+            else:
+                git_log = _collect_git_log(resolved_repo, since_date, paths)
+        except subprocess.CalledProcessError as e:
+            print(f"Warning: Git command failed: {_git_error(e)}", file=sys.stderr)
+            git_log = []
 
-    # Collect signals
-    print("Analyzing git history...", file=sys.stderr)
-    git_signals = git_analyzer.analyze()
-    print(f"  Found {len(git_signals)} git signals", file=sys.stderr)
+        # Collect signals
+        print("Analyzing git history...", file=sys.stderr)
+        git_signals = git_analyzer.analyze(git_log)
+        print(f"  Found {len(git_signals)} git signals", file=sys.stderr)
 
-    print("Analyzing agent memory...", file=sys.stderr)
-    memory_signals = memory_analyzer.analyze()
-    print(f"  Found {len(memory_signals)} memory signals", file=sys.stderr)
+        print("Analyzing agent memory...", file=sys.stderr)
+        memory_signals = memory_future.result()
+        print(f"  Found {len(memory_signals)} memory signals", file=sys.stderr)
 
     print("Analyzing code churn...", file=sys.stderr)
-    churn_signals = churn_analyzer.analyze()
+    churn_signals = churn_analyzer.analyze(git_log)
     print(f"  Found {len(churn_signals)} hot files", file=sys.stderr)
 
     # Compile results
     return {
-        'timestamp': datetime.now().isoformat(),
-        'repo_path': str(Path(repo_path).resolve()),
+        'repo_path': repo_path,
         'collection_period_days': days,
         'git_signals': git_signals,
         'memory_signals': memory_signals,
@@ -516,8 +648,156 @@ def collect_all_signals(
     }
 
 
-def main():
-    """Main entry point for CLI usage."""
+@functools.lru_cache(maxsize=8)
+def _collect_signals_cached(
+    resolved_repo: Path,
+    since_date: str,
+    days: int,
+    memory_path: Optional[str],
+    top_n_hot_files: int,
+    paths: Optional[Tuple[str, ...]],
+    head_sha: str,
+    memory_mtime_ns: int
+) -> Dict[str, Any]:
+    """
+    Memoized _collect_signals.
+
+    head_sha and memory_mtime_ns are not used directly; they are part of the
+    cache key so a new commit or a rewritten memory file forces a fresh run.
+    paths is a tuple so it can be hashed. Callers must copy the result
+    before changing it.
+    """
+    return _collect_signals(
+        resolved_repo, since_date, days, memory_path, top_n_hot_files,
+        list(paths) if paths else None
+    )
+
+
+def collect_all_signals(
+    repo_path: str,
+    days: int = 30,
+    memory_path: Optional[str] = None,
+    top_n_hot_files: int = 10,
+    paths: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Collect all pattern signals from git history, agent memory, and code churn.
+
+    Args:
+        repo_path: Path to git repository
+        days: Number of days to look back in history
+        memory_path: Path to agent memory file (optional)
+        top_n_hot_files: Number of hot files to include
+        paths: Limit git history and churn to these paths (optional)
+
+    Returns:
+        Dictionary with structure:
+        {
+            "timestamp": "ISO-8601 datetime",
+            "repo_path": "/path/to/repo",
+            "collection_period_days": 30,
+            "git_signals": [...],
+            "memory_signals": [...],
+            "churn_signals": [...]
+        }
+    """
+    print(f"Collecting pattern signals from {repo_path}...", file=sys.stderr)
+    print(f"Looking back {days} days", file=sys.stderr)
+
+    # Resolve the repo and start date once for both git-based analyzers
+    resolved_repo = Path(repo_path).resolve()
+    since_date = _since_date(days)
+
+    # Within one process, reuse results while HEAD and the memory file are unchanged
+    head_sha = _git_head(resolved_repo)
+    if head_sha is None:
+        results = _collect_signals(resolved_repo, since_date, days, memory_path, top_n_hot_files, paths)
+    else:
+        try:
+            memory_mtime_ns = AgentMemoryAnalyzer(memory_path).memory_path.stat().st_mtime_ns
+        except OSError:
+            memory_mtime_ns = 0
+
+        results = copy.deepcopy(_collect_signals_cached(
+            resolved_repo, since_date, days, memory_path, top_n_hot_files,
+            tuple(paths) if paths else None, head_sha, memory_mtime_ns
+        ))
+
+    return {'timestamp': datetime.now().isoformat(), **results}
+
+
+def _write_output(results: Dict[str, Any], path: Optional[str], pretty: bool = False):
+    """
+    Serialize results straight to a file or stdout without an intermediate str.
+
+    orjson produces bytes that are written as-is; the stdlib fallback streams
+    through json.dump.
+
+    Args:
+        results: Results to serialize
+        path: Output file path, or None for stdout
+        pretty: Indent the JSON output
+    """
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if path:
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b'\n')
+            sys.stdout.buffer.flush()
+    else:
+        options = {'indent': 2} if pretty else {}
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, **options)
+        else:
+            json.dump(results, sys.stdout, **options)
+            sys.stdout.write('\n')
+
+    if path:
+        print(f"\nResults written to {path}", file=sys.stderr)
+
+
+def _write_ndjson(results: Dict[str, Any], path: Optional[str]):
+    """
+    Write results as NDJSON: a header line, then one line per signal.
+
+    Each signal is serialized and written on its own, so the whole document
+    is never held as one string.
+
+    Args:
+        results: Results to serialize
+        path: Output file path, or None for stdout
+    """
+    header = {key: value for key, value in results.items() if not key.endswith('_signals')}
+    signals = chain(results['git_signals'], results['memory_signals'], results['churn_signals'])
+
+    if path is None:
+        sys.stdout.flush()
+    with open(path, 'wb') if path else nullcontext(sys.stdout.buffer) as f:
+        if orjson is not None:
+            f.write(orjson.dumps({'header': header}) + b'\n')
+            for signal in signals:
+                f.write(orjson.dumps({'signal': signal}) + b'\n')
+        else:
+            f.write(json.dumps({'header': header}).encode('utf-8') + b'\n')
+            for signal in signals:
+                f.write(json.dumps({'signal': signal}).encode('utf-8') + b'\n')
+        f.flush()
+
+    if path:
+        print(f"\nResults written to {path}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Collect pattern detection signals from git history, agent memory, and code churn.'
     )
@@ -542,6 +822,12 @@ def main():
         default=10,
         help='Number of hot files to include (default: 10)'
     )
+    parser.add_argument(
+        '--paths',
+        nargs='+',
+        metavar='PATH',
+        help='Only analyze git history touching these paths (default: whole repo)'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (default: print to stdout)'
@@ -551,8 +837,13 @@ def main():
         action='store_true',
         help='Pretty-print JSON output'
     )
+    parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Write NDJSON: a {"header": ...} line, then one {"signal": ...} line per signal (ignores --pretty)'
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Collect signals
@@ -560,22 +851,15 @@ def main():
             repo_path=args.repo_path,
             days=args.days,
             memory_path=args.memory_path,
-            top_n_hot_files=args.top_n
+            top_n_hot_files=args.top_n,
+            paths=args.paths
         )
 
-        # Format output
-        if args.pretty:
-            output = json.dumps(results, indent=2)
-        else:
-            output = json.dumps(results)
-
         # Write output
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output)
-            print(f"\nResults written to {args.output}", file=sys.stderr)
+        if args.ndjson:
+            _write_ndjson(results, args.output)
         else:
-            print(output)
+            _write_output(results, args.output, args.pretty)
 
         # Print summary
         summary = results['summary']
@@ -31,27 +31,44 @@ Output:
 
 import argparse
 import ast
+import functools
+import hashlib
 import json
 import os
 import re
+import string
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
 
-# Test generation prompt template
-TEST_GENERATION_PROMPT = """You are a Python testing expert specializing in static code analysis and anti-pattern detection.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
 
-Generate a pytest defeat test for the following anti-pattern:
 
-**Pattern Name:** {pattern_name}
-**Description:** {description}
-**Evidence:** {evidence}
-**Frequency:** {frequency}
-**Impact:** {impact}
-**Root Cause:** {root_cause}
+def _read_stdin() -> Union[bytes, str]:
+    """
+    Read all of stdin for _loads.
+
+    Returns bytes from the binary buffer when there is one; a substituted
+    text stream without one (e.g. io.StringIO) is read as str.
+    """
+    buffer = getattr(sys.stdin, 'buffer', None)
+    return buffer.read() if buffer is not None else sys.stdin.read()
+
+
+# Test generation prompt template
+TEST_GENERATION_PROMPT = """You are a Python testing expert specializing in static code analysis and anti-pattern detection.
 
 **REQUIREMENTS:**
 
@@ -61,7 +78,7 @@ Generate a pytest defeat test for the following anti-pattern:
    - One or more test functions
 
 2. **Test Function:**
-   - Name: test_no_{pattern_slug} or similar descriptive name
+   - Name: test_no_<pattern_slug> or similar descriptive name
    - Docstring explaining what the test prevents
    - Implementation that FAILS when pattern is detected
    - Clear assertion messages with file/line information
@@ -74,6 +91,15 @@ Generate a pytest defeat test for the following anti-pattern:
 
 4. **Best Practices:**
    - Scan relevant file types only (*.py for Python patterns)
+   - Walk the tree with os.scandir recursion as in the examples, not Path.rglob
+     (scandir reuses directory-entry types instead of a stat() per file)
+   - Read whole files with read_bytes() (decode for regex scans; ast.parse takes
+     bytes directly) rather than read_text()
+   - Scan each file in a module-level _scan_file(py_file, project_root) returning
+     violation strings, and map it over a ProcessPoolExecutor once the tree has
+     PARALLEL_MIN_FILES or more files, as in the examples
+   - For AST checks tied to a keyword (e.g. `raise`, `except`), skip files whose
+     bytes do not contain it before calling ast.parse
    - Skip test files, examples, scripts unless pattern applies there too
    - Use relative paths from project root
    - Provide helpful error messages with locations
@@ -83,24 +109,62 @@ Generate a pytest defeat test for the following anti-pattern:
 
 **Regex Pattern Example:**
 ```python
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+# Below this many files, scan in-process (pool startup costs more than it saves)
+PARALLEL_MIN_FILES = 64
+
+# Matches stay on one line, like a line-by-line scan
+SILENT_FALLBACK = re.compile(r'\\.get\\([^,\\n]+,[^\\S\\n]*(0|None|\'\'|""|\\[\\]|\\{{\\}})\\)')
+
+
+def _iter_py_files(root):
+    \"\"\"Yield .py files under root, walking with os.scandir (no stat() per entry).\"\"\"
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_py_files(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def _scan_file(py_file, project_root):
+    \"\"\"Return violations in one file (module level so worker processes can pickle it).\"\"\"
+    try:
+        content = py_file.read_bytes().decode('utf-8', errors='replace')
+    except OSError:
+        return []
+    violations = []
+    # One regex pass over the whole file; line numbers from match offsets
+    for match in SILENT_FALLBACK.finditer(content):
+        start = content.rfind('\\n', 0, match.start()) + 1
+        end = content.find('\\n', match.end())
+        line = content[start:] if end == -1 else content[start:end]
+        i = content.count('\\n', 0, start) + 1
+        violations.append(f"{{py_file.relative_to(project_root)}}:{{i}}: {{line.strip()}}")
+    return violations
+
+
 def test_no_silent_fallbacks():
     \"\"\"Detect .get(key, default) patterns that hide missing data.\"\"\"
     project_root = Path(__file__).parent.parent.parent
+    paths = [p for p in _iter_py_files(project_root) if 'test_' not in p.name]
     violations = []
 
-    for py_file in project_root.rglob("*.py"):
-        if 'test_' in py_file.name:
-            continue
-        try:
-            content = py_file.read_text()
-            for i, line in enumerate(content.split('\\n'), 1):
-                if re.search(r'\\.get\\([^,]+,\\s*(0|None|\'\'|""|\\[\\]|\\{{\\}})\\)', line):
-                    violations.append(f"{{py_file.relative_to(project_root)}}:{{i}}: {{line.strip()}}")
-        except Exception:
-            continue
+    if len(paths) < PARALLEL_MIN_FILES:
+        for py_file in paths:
+            violations.extend(_scan_file(py_file, project_root))
+    else:
+        with ProcessPoolExecutor() as ex:
+            for file_violations in ex.map(_scan_file, paths, repeat(project_root), chunksize=32):
+                violations.extend(file_violations)
 
     assert not violations, f"Silent fallbacks found:\\n" + "\\n".join(violations[:10])
 ```
@@ -108,25 +172,58 @@ def test_no_silent_fallbacks():
 **AST Pattern Example:**
 ```python
 import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+# Below this many files, scan in-process (pool startup costs more than it saves)
+PARALLEL_MIN_FILES = 64
+
+
+def _iter_py_files(root):
+    \"\"\"Yield .py files under root, walking with os.scandir (no stat() per entry).\"\"\"
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_py_files(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def _scan_file(py_file, project_root):
+    \"\"\"Return violations in one file (module level so worker processes can pickle it).\"\"\"
+    try:
+        tree = ast.parse(py_file.read_bytes())
+    except SyntaxError:
+        return []
+    violations = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            length = node.end_lineno - node.lineno + 1
+            if length > 50:
+                violations.append(
+                    f"{{py_file.relative_to(project_root)}}:{{node.name}} = {{length}} lines"
+                )
+    return violations
+
+
 def test_no_god_functions():
     \"\"\"Functions should be under 50 lines for maintainability.\"\"\"
     project_root = Path(__file__).parent.parent.parent
+    paths = list(_iter_py_files(project_root))
     violations = []
 
-    for py_file in project_root.rglob("*.py"):
-        try:
-            tree = ast.parse(py_file.read_text())
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    length = node.end_lineno - node.lineno + 1
-                    if length > 50:
-                        violations.append(
-                            f"{{py_file.relative_to(project_root)}}:{{node.name}} = {{length}} lines"
-                        )
-        except SyntaxError:
-            continue
+    if len(paths) < PARALLEL_MIN_FILES:
+        for py_file in paths:
+            violations.extend(_scan_file(py_file, project_root))
+    else:
+        with ProcessPoolExecutor() as ex:
+            for file_violations in ex.map(_scan_file, paths, repeat(project_root), chunksize=32):
+                violations.extend(file_violations)
 
     assert not violations, f"God functions found:\\n" + "\\n".join(violations[:10])
 ```
@@ -136,9 +233,81 @@ def test_no_god_functions():
 Return ONLY valid Python code (no markdown, no commentary, no code fences).
 Start with the module docstring, then imports, then test functions.
 
+Generate a pytest defeat test for the following anti-pattern:
+
+**Pattern Name:** {pattern_name}
+**Pattern Slug:** {pattern_slug}
+**Description:** {description}
+**Evidence:** {evidence}
+**Frequency:** {frequency}
+**Impact:** {impact}
+**Root Cause:** {root_cause}
+
 Generate the complete defeat test now:
 """
 
+# Static instructions (role, requirements, examples) preceding the output
+# format and pattern details. They are identical on every call, so the SDK
+# path sends them as a separate block marked for prompt caching. Prompts are
+# built by concatenation, so the prefix's {{ }} escapes are undone here once.
+TEST_GENERATION_PREFIX, _TEST_GENERATION_SUFFIX = TEST_GENERATION_PROMPT.split('**OUTPUT FORMAT:**', 1)
+TEST_GENERATION_PREFIX = TEST_GENERATION_PREFIX.replace('{{', '{').replace('}}', '}')
+_TEST_GENERATION_SUFFIX = '**OUTPUT FORMAT:**' + _TEST_GENERATION_SUFFIX
+
+# Pattern details block, reused once per pattern by the batch prompt
+_PATTERN_DETAILS = '**Pattern Name:**' + (
+    _TEST_GENERATION_SUFFIX.split('**Pattern Name:**', 1)[1].split('\nGenerate the complete', 1)[0]
+)
+
+# Batch request: several patterns per Claude call, one delimited file per
+# pattern. It follows TEST_GENERATION_PREFIX like the single-pattern suffix.
+BATCH_PROMPT_INTRO = """Generate one pytest defeat test for EACH of the following {count} anti-patterns:
+
+"""
+
+BATCH_OUTPUT_FORMAT = """**OUTPUT FORMAT:**
+
+For each pattern, return ONLY valid Python code (no markdown, no commentary, no code fences)
+between marker lines naming the pattern's file, exactly like this:
+
+=== BEGIN test_<pattern_slug>.py ===
+<module docstring, imports, test functions>
+=== END ===
+
+Generate all {count} defeat tests now, in the order given:
+"""
+
+# Splits a batch response into (filename, code) blocks
+_BATCH_BLOCK_RE = re.compile(
+    r'^=== BEGIN (\S+) ===[ \t]*\n(.*?)^=== END ===', re.MULTILINE | re.DOTALL
+)
+
+# Slug normalization (see TestGenerator._generate_pattern_slug)
+_SLUG_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_SLUG_UNDERSCORES_RE = re.compile(r'_+')
+
+# A response wrapped in a markdown code fence; group 1 is the code inside
+_CODE_FENCE_RE = re.compile(r'\A```[^\n]*\n?(.*?)(?:\n\s*```)?\Z', re.DOTALL)
+
+# Patterns sent to Claude per call (1 = one call per pattern)
+PATTERNS_PER_CALL = 5
+
+# Response budget for a batch call (SDK only)
+BATCH_MAX_TOKENS = 16000
+
+# Claude calls in flight at once
+GENERATION_CONCURRENCY = 4
+
+# Fingerprint line written into each test file; matching files are not regenerated
+PATTERN_HASH_PREFIX = '# pattern-hash: '
+_PATTERN_HASH_RE = re.compile(r'^# pattern-hash: ([0-9a-f]{64})[ \t]*$', re.MULTILINE)
+
+# Threads writing test files at once
+WRITE_CONCURRENCY = 8
+
+# Syntax verdicts for --validate-only, keyed by Python version and file hash
+VALIDATION_CACHE_FILE = 'validation.json'
+
 # Mock test templates for testing without API calls
 MOCK_TESTS = {
     "silent_fallback": r'''#!/usr/bin/env python3
@@ -149,31 +318,75 @@ Severity: HIGH
 Generated: {generated_date}
 Description: Using .get() with default values instead of explicit validation
 """
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+# Below this many files, scan in-process (pool startup costs more than it saves)
+PARALLEL_MIN_FILES = 64
+
+# Pattern to detect .get() with default values (matches stay on one line)
+PATTERN = re.compile(r'\.get\([^,\n]+,[^\S\n]*(0|None|\'\'|""|\\[\\]|\\{{\\}})\)')
+
+
+def _iter_py_files(root):
+    """Yield .py files under root, walking with os.scandir (no stat() per entry)."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_py_files(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def _scan_file(py_file, project_root):
+    """Return violations in one file (module level so worker processes can pickle it)."""
+    try:
+        content = py_file.read_bytes().decode('utf-8', errors='replace')
+    except OSError:
+        return []
+
+    violations = []
+    # One regex pass over the whole file; line numbers come from match offsets
+    lineno, pos, last_lineno = 1, 0, 0
+    for match in PATTERN.finditer(content):
+        lineno += content.count('\n', pos, match.start())
+        pos = match.start()
+        if lineno == last_lineno:
+            continue  # Report each line once
+        last_lineno = lineno
+
+        start = content.rfind('\n', 0, pos) + 1
+        end = content.find('\n', pos)
+        line = content[start:] if end == -1 else content[start:end]
+        relative_path = py_file.relative_to(project_root)
+        violations.append(f"{{relative_path}}:{{lineno}}: {{line.strip()}}")
+    return violations
+
 
 def test_no_silent_fallbacks():
     """Detect .get(key, default) patterns that silently hide missing data."""
     project_root = Path(__file__).parent.parent.parent
+    # Skip test files and examples
+    paths = [
+        p for p in _iter_py_files(project_root)
+        if 'test_' not in p.name and 'example' not in str(p).lower()
+    ]
     violations = []
 
-    # Pattern to detect .get() with default values
-    pattern = r'\.get\([^,]+,\s*(0|None|\'\'|""|\\[\\]|\\{{\\}})\)'
-
-    for py_file in project_root.rglob("*.py"):
-        # Skip test files and examples
-        if 'test_' in py_file.name or 'example' in str(py_file).lower():
-            continue
-
-        try:
-            content = py_file.read_text()
-            for i, line in enumerate(content.split('\n'), 1):
-                if re.search(pattern, line):
-                    relative_path = py_file.relative_to(project_root)
-                    violations.append(f"{{relative_path}}:{{i}}: {{line.strip()}}")
-        except Exception:
-            continue
+    if len(paths) < PARALLEL_MIN_FILES:
+        for py_file in paths:
+            violations.extend(_scan_file(py_file, project_root))
+    else:
+        # Spread parsing across CPUs; workers re-import this module for _scan_file
+        with ProcessPoolExecutor() as ex:
+            for file_violations in ex.map(_scan_file, paths, repeat(project_root), chunksize=32):
+                violations.extend(file_violations)
 
     assert not violations, (
         f"Silent fallbacks found (use explicit validation instead):\n" +
@@ -189,37 +402,72 @@ Generated: {generated_date}
 Description: Raising exceptions without context about what failed
 """
 import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+# Below this many files, scan in-process (pool startup costs more than it saves)
+PARALLEL_MIN_FILES = 64
+
+
+def _iter_py_files(root):
+    """Yield .py files under root, walking with os.scandir (no stat() per entry)."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_py_files(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def _scan_file(py_file, project_root):
+    """Return violations in one file (module level so worker processes can pickle it)."""
+    source = py_file.read_bytes()
+    # Parsing dominates the scan; files that never raise cannot violate
+    if b'raise' not in source:
+        return []
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+
+    violations = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Raise):
+            # Check if exception has no message or very short message
+            if node.exc and isinstance(node.exc, ast.Call):
+                if not node.exc.args or (
+                    len(node.exc.args) == 1 and
+                    isinstance(node.exc.args[0], ast.Constant) and
+                    len(str(node.exc.args[0].value)) < 10
+                ):
+                    relative_path = py_file.relative_to(project_root)
+                    violations.append(
+                        f"{{relative_path}}:{{node.lineno}}: "
+                        f"Exception lacks context"
+                    )
+    return violations
+
 
 def test_no_missing_error_context():
     """Detect raise statements without contextual information."""
     project_root = Path(__file__).parent.parent.parent
+    paths = [p for p in _iter_py_files(project_root) if 'test_' not in p.name]
     violations = []
 
-    for py_file in project_root.rglob("*.py"):
-        if 'test_' in py_file.name:
-            continue
-
-        try:
-            tree = ast.parse(py_file.read_text())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Raise):
-                    # Check if exception has no message or very short message
-                    if node.exc and isinstance(node.exc, ast.Call):
-                        if not node.exc.args or (
-                            len(node.exc.args) == 1 and
-                            isinstance(node.exc.args[0], ast.Constant) and
-                            len(str(node.exc.args[0].value)) < 10
-                        ):
-                            relative_path = py_file.relative_to(project_root)
-                            violations.append(
-                                f"{{relative_path}}:{{node.lineno}}: "
-                                f"Exception lacks context"
-                            )
-        except SyntaxError:
-            continue
+    if len(paths) < PARALLEL_MIN_FILES:
+        for py_file in paths:
+            violations.extend(_scan_file(py_file, project_root))
+    else:
+        # Spread parsing across CPUs; workers re-import this module for _scan_file
+        with ProcessPoolExecutor() as ex:
+            for file_violations in ex.map(_scan_file, paths, repeat(project_root), chunksize=32):
+                violations.extend(file_violations)
 
     assert not violations, (
         f"Exceptions without context found:\\n" +
@@ -235,29 +483,58 @@ Severity: {severity}
 Generated: {generated_date}
 Description: {description}
 """
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+# Below this many files, scan in-process (pool startup costs more than it saves)
+PARALLEL_MIN_FILES = 64
 
-def test_no_{pattern_slug}():
-    """Detect and prevent {pattern_title} pattern."""
-    project_root = Path(__file__).parent.parent.parent
-    violations = []
 
+def _iter_py_files(root):
+    """Yield .py files under root, walking with os.scandir (no stat() per entry)."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_py_files(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def _scan_file(py_file, project_root):
+    """Return violations in one file (module level so worker processes can pickle it)."""
+    try:
+        content = py_file.read_bytes().decode('utf-8', errors='replace')
+    except OSError:
+        return []
+
+    violations = []
     # TODO: Implement pattern detection logic
     # This is a placeholder test - customize based on pattern
+    # Example: if pattern in content:
+    #     violations.append(f"{{py_file.relative_to(project_root)}}:{{line_num}}")
+    return violations
 
-    for py_file in project_root.rglob("*.py"):
-        if 'test_' in py_file.name:
-            continue
 
-        try:
-            content = py_file.read_text()
-            # Add pattern detection here
-            # Example: if pattern in content:
-            #     violations.append(f"{{py_file}}:{{line_num}}")
-        except Exception:
-            continue
+def test_no_{pattern_slug}():
+    """Detect and prevent {pattern_title} pattern."""
+    project_root = Path(__file__).parent.parent.parent
+    paths = [p for p in _iter_py_files(project_root) if 'test_' not in p.name]
+    violations = []
+
+    if len(paths) < PARALLEL_MIN_FILES:
+        for py_file in paths:
+            violations.extend(_scan_file(py_file, project_root))
+    else:
+        # Spread parsing across CPUs; workers re-import this module for _scan_file
+        with ProcessPoolExecutor() as ex:
+            for file_violations in ex.map(_scan_file, paths, repeat(project_root), chunksize=32):
+                violations.extend(file_violations)
 
     assert not violations, (
         f"{pattern_title} pattern found:\\n" +
@@ -267,6 +544,69 @@ def test_no_{pattern_slug}():
 }
 
 
+
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Parse a str.format template once into (literal text, field name) pairs.
+
+    Args:
+        template: Template using {field} placeholders and {{ }} escapes
+
+    Returns:
+        Pairs in order; the field name is None after the trailing literal
+    """
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+
+def _render_template(parts: List[Tuple[str, Optional[str]]], fields: Dict[str, Any]) -> str:
+    """
+    Fill a template compiled by _compile_template (same output as str.format).
+
+    Args:
+        parts: Compiled template
+        fields: Placeholder values
+
+    Returns:
+        Rendered text
+    """
+    return ''.join(
+        literal if field is None else literal + str(fields[field])
+        for literal, field in parts
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _check_syntax(code: str) -> Tuple[bool, Optional[str]]:
+    """
+    Parse code once per distinct text and remember the verdict.
+
+    Mock templates render to the same text for every pattern they match,
+    and cached tests repeat across runs in one process, so most calls are hits.
+    Keyed on the text itself: placeholders such as a pattern title inside a
+    docstring can break parsing, so a template key alone is not enough.
+
+    Args:
+        code: Python code to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        ast.parse(code)
+        return True, None
+    except SyntaxError as e:
+        return False, f"Syntax error at line {e.lineno}: {e.msg}"
+    except Exception as e:
+        return False, f"Parse error: {str(e)}"
+
+
+# MOCK_TESTS parsed once at import instead of by str.format on every pattern
+_MOCK_TEMPLATE_PARTS = {key: _compile_template(template) for key, template in MOCK_TESTS.items()}
+
+# Keys tried for partial slug matches, most specific (longest) first
+_MOCK_MATCH_KEYS = sorted((key for key in MOCK_TESTS if key != 'default'), key=len, reverse=True)
+
+
 class TestGenerator:
     """Generates defeat tests from pattern analysis."""
 
@@ -274,7 +614,13 @@ class TestGenerator:
         self,
         api_key: Optional[str] = None,
         use_cli: bool = True,
-        mock: bool = False
+        mock: bool = False,
+        batch_size: int = PATTERNS_PER_CALL,
+        concurrency: int = GENERATION_CONCURRENCY,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        force: bool = False
     ):
         """
         Initialize test generator.
@@ -283,19 +629,87 @@ class TestGenerator:
             api_key: Anthropic API key (optional if using CLI or environment variable)
             use_cli: Use Claude CLI instead of Python SDK (default: True)
             mock: Use mock templates instead of real API calls (default: False)
+            batch_size: Patterns to generate per Claude call (default: PATTERNS_PER_CALL)
+            concurrency: Claude calls to run in parallel, 1 for sequential
+                (default: GENERATION_CONCURRENCY)
+            use_cache: Reuse tests cached for identical patterns (default: True)
+            cache_dir: Directory for cached tests (default: tests/ under
+                PATTERN_CACHE_DIR, or ~/.cache/pattern-detector/tests)
+            output_dir: Directory tests will be written to; patterns whose
+                existing file carries a matching pattern hash are skipped
+            force: Regenerate every pattern even if its file is unchanged
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         self.use_cli = use_cli
         self.mock = mock
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else Path(
+            os.environ.get('PATTERN_CACHE_DIR', '~/.cache/pattern-detector')
+        ).expanduser() / 'tests'
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.force = force
+
+        # What the generated code depends on besides the pattern itself
+        source = 'mock\0' + json.dumps(MOCK_TESTS, sort_keys=True) if mock else TEST_GENERATION_PROMPT
+        self._source_digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+
         self.max_retries = 3
         self.retry_delay = 2
+        self._sdk_client = None
+        self._sdk_lock = threading.Lock()
+
+    @property
+    def _sdk(self):
+        """
+        Anthropic client, created on first use and shared by all calls.
 
-    def _call_claude_cli(self, prompt: str) -> str:
+        Concurrent generation threads reuse its HTTP connection pool, so each
+        call after the first skips the TCP/TLS handshake.
+
+        Raises:
+            ImportError: If anthropic SDK is not installed
+            ValueError: If no API key is available
+        """
+        with self._sdk_lock:
+            if self._sdk_client is None:
+                # Imported here so mock/CLI runs and --help never load the SDK
+                try:
+                    import anthropic
+                except ImportError:
+                    raise ImportError(
+                        "anthropic SDK not installed. Install with: pip install anthropic\n"
+                        "Or use --use-cli flag to use the Claude CLI instead."
+                    )
+
+                if not self.api_key:
+                    raise ValueError(
+                        "ANTHROPIC_API_KEY environment variable not set and no API key provided"
+                    )
+
+                self._sdk_client = anthropic.Anthropic(api_key=self.api_key)
+
+        return self._sdk_client
+
+    def _call_claude_cli(self, prompt: str, timeout: int = 120, expected_blocks: int = 0) -> str:
         """
         Call Claude using the CLI.
 
+        Each call runs its own `claude -p` process on purpose: a long-lived
+        session would carry earlier patterns' conversation into later
+        prompts (and grow every request). Process startup is amortized by
+        batching PATTERNS_PER_CALL patterns per call instead.
+
+        stdout is read line by line as it arrives, so a batch response is
+        complete as soon as its last `=== END ===` marker is seen; stderr is
+        drained on a helper thread so a full pipe cannot stall the CLI.
+
         Args:
             prompt: Test generation prompt
+            timeout: Seconds to wait for the CLI (default: 120)
+            expected_blocks: Batch blocks requested; reading stops after that
+                many end markers (0 = read until the CLI exits)
 
         Returns:
             Claude's response
@@ -303,62 +717,253 @@ class TestGenerator:
         Raises:
             Exception: If CLI call fails
         """
-        try:
-            result = subprocess.run(
-                ['claude', '-p', prompt],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=120
-            )
-            return result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            raise Exception("Claude CLI call timed out after 120 seconds")
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Claude CLI call failed: {e.stderr}")
+        process = subprocess.Popen(
+            ['claude', '-p', prompt],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+        stderr_lines: List[str] = []
+        drain = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        drain.start()
+
+        # Reading stdout blocks, so the deadline is enforced by killing the CLI
+        deadline = time.monotonic() + timeout
+        timed_out = []
+
+        def kill():
+            timed_out.append(True)
+            process.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
 
-    def _call_claude_sdk(self, prompt: str) -> str:
+        lines = []
+        complete = False
+        try:
+            ended = 0
+            for line in process.stdout:
+                lines.append(line)
+                if expected_blocks and line.startswith('=== END ==='):
+                    ended += 1
+                    if ended == expected_blocks:
+                        complete = True
+                        break
+        finally:
+            if complete:
+                # The response is all here; don't wait for the CLI to wind down
+                process.terminate()
+            process.stdout.close()
+            returncode = process.wait()
+            timer.cancel()
+            # A lingering grandchild can hold stderr open; stop waiting at the deadline
+            drain.join(max(0.0, deadline - time.monotonic()))
+
+        if timed_out and not complete:
+            raise Exception(f"Claude CLI call timed out after {timeout} seconds")
+        if returncode != 0 and not complete:
+            raise Exception(f"Claude CLI call failed: {''.join(stderr_lines)}")
+        return ''.join(lines).strip()
+
+    def _call_claude_sdk(self, request: str, max_tokens: int = 4000) -> str:
         """
         Call Claude using the Python SDK.
 
+        The static TEST_GENERATION_PREFIX goes in its own content block marked
+        for prompt caching, so repeated calls reuse it; only the request varies.
+
         Args:
-            prompt: Test generation prompt
+            request: Pattern-specific prompt text following TEST_GENERATION_PREFIX
+            max_tokens: Maximum tokens in the response
 
         Returns:
             Claude's response
 
         Raises:
             ImportError: If anthropic SDK is not installed
+            ValueError: If no API key is available
             Exception: If API call fails
         """
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError(
-                "anthropic SDK not installed. Install with: pip install anthropic\n"
-                "Or use --use-cli flag to use the Claude CLI instead."
-            )
-
-        if not self.api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY environment variable not set and no API key provided"
-            )
-
-        client = anthropic.Anthropic(api_key=self.api_key)
-
-        response = client.messages.create(
+        response = self._sdk.messages.create(
             model="claude-sonnet-4-5-20250929",
-            max_tokens=4000,
+            max_tokens=max_tokens,
             messages=[
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": TEST_GENERATION_PREFIX,
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {
+                            "type": "text",
+                            "text": request
+                        }
+                    ]
                 }
             ]
         )
 
         return response.content[0].text
 
+    def _call_claude(self, request: str, patterns: int = 1) -> str:
+        """
+        Call Claude through the CLI or SDK, sized for the number of tests requested.
+
+        Args:
+            request: Pattern-specific prompt text following TEST_GENERATION_PREFIX
+            patterns: Number of tests the request asks for
+
+        Returns:
+            Claude's response
+
+        Raises:
+            Exception: If the call fails
+        """
+        if self.use_cli:
+            return self._call_claude_cli(
+                TEST_GENERATION_PREFIX + request,
+                timeout=120 * patterns,
+                expected_blocks=patterns if patterns > 1 else 0
+            )
+        return self._call_claude_sdk(request, max_tokens=4000 if patterns == 1 else BATCH_MAX_TOKENS)
+
+    def _prompt_fields(self, pattern: Dict[str, Any], pattern_slug: str) -> Dict[str, str]:
+        """
+        Prompt placeholder values for a pattern.
+
+        Args:
+            pattern: Pattern dictionary
+            pattern_slug: Pattern slug identifier
+
+        Returns:
+            Keyword arguments for TEST_GENERATION_PROMPT.format
+        """
+        return {
+            'pattern_name': pattern['name'],
+            'pattern_slug': pattern_slug,
+            'description': pattern['description'],
+            'evidence': '\n'.join(f"  - {e}" for e in pattern.get('evidence', [])),
+            'frequency': pattern.get('frequency', 'unknown'),
+            'impact': pattern.get('impact', 'medium'),
+            'root_cause': pattern.get('root_cause', 'Unknown')
+        }
+
+    def _build_batch_prompt(self, patterns: List[Dict[str, Any]], slugs: List[str]) -> str:
+        """
+        Build one request asking for a delimited test file per pattern.
+
+        Args:
+            patterns: Pattern dictionaries
+            slugs: Slug for each pattern, in the same order
+
+        Returns:
+            Batch request, to follow TEST_GENERATION_PREFIX
+        """
+        parts = [BATCH_PROMPT_INTRO.format(count=len(patterns))]
+        for i, (pattern, slug) in enumerate(zip(patterns, slugs), 1):
+            parts.append(f"### Pattern {i}: test_{slug}.py\n\n")
+            parts.append(_PATTERN_DETAILS.format(**self._prompt_fields(pattern, slug)))
+            parts.append('\n')
+        parts.append(BATCH_OUTPUT_FORMAT.format(count=len(patterns)))
+        return ''.join(parts)
+
+    def _split_batch_response(self, response: str) -> Dict[str, str]:
+        """
+        Split a batch response into test code per filename.
+
+        Args:
+            response: Raw response to a batch prompt
+
+        Returns:
+            Dictionary mapping filename to cleaned test code
+        """
+        return {
+            filename: self._clean_claude_response(code)
+            for filename, code in _BATCH_BLOCK_RE.findall(response)
+        }
+
+    def _pattern_hash(self, pattern: Dict[str, Any], pattern_slug: str) -> str:
+        """
+        Fingerprint of everything a generated test depends on.
+
+        Covers the prompt fields and the generation source (prompt template,
+        or mock templates in mock mode), so a file written from a different
+        source or an edited pattern never matches.
+
+        Args:
+            pattern: Pattern dictionary
+            pattern_slug: Pattern slug identifier
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        fields = json.dumps(self._prompt_fields(pattern, pattern_slug), sort_keys=True)
+        return hashlib.sha256(f"{self._source_digest}\0{fields}".encode('utf-8')).hexdigest()
+
+    def _cache_path(self, pattern: Dict[str, Any], pattern_slug: str) -> Path:
+        """
+        Location of the cached test for a pattern.
+
+        The key covers the prompt template and every prompt field, so editing
+        the instructions or the pattern misses the cache.
+
+        Args:
+            pattern: Pattern dictionary
+            pattern_slug: Pattern slug identifier
+
+        Returns:
+            Path of the cache file (may not exist)
+        """
+        fields = json.dumps(self._prompt_fields(pattern, pattern_slug), sort_keys=True)
+        key = hashlib.sha256(f"{TEST_GENERATION_PROMPT}\0{fields}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.py"
+
+    def _load_cached_test(self, pattern: Dict[str, Any], pattern_slug: str) -> Optional[str]:
+        """
+        Load the test cached for an identical pattern.
+
+        Args:
+            pattern: Pattern dictionary
+            pattern_slug: Pattern slug identifier
+
+        Returns:
+            Cached test code, or None on a miss or caching disabled
+        """
+        if not self.use_cache:
+            return None
+
+        try:
+            return self._cache_path(pattern, pattern_slug).read_text()
+        except OSError:
+            return None
+
+    def _store_cached_test(self, pattern: Dict[str, Any], pattern_slug: str, test_code: str):
+        """
+        Cache a generated test, writing atomically so readers never see partial files.
+
+        Args:
+            pattern: Pattern dictionary
+            pattern_slug: Pattern slug identifier
+            test_code: Validated test code from Claude
+        """
+        if not self.use_cache:
+            return
+
+        path = self._cache_path(pattern, pattern_slug)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as f:
+                f.write(test_code)
+            os.replace(f.name, path)
+        except OSError as e:
+            print(f"Warning: Failed to write test cache: {e}", file=sys.stderr)
+
     def _generate_pattern_slug(self, pattern_name: str) -> str:
         """
         Generate a valid Python identifier from pattern name.
@@ -369,15 +974,10 @@ class TestGenerator:
         Returns:
             snake_case slug suitable for function/file names
         """
-        # Convert to lowercase
-        slug = pattern_name.lower()
-        # Replace spaces and special chars with underscores
-        slug = re.sub(r'[^a-z0-9]+', '_', slug)
-        # Remove leading/trailing underscores
-        slug = slug.strip('_')
-        # Collapse multiple underscores
-        slug = re.sub(r'_+', '_', slug)
-        return slug
+        # Lowercase, replace spaces and special chars with underscores,
+        # trim leading/trailing underscores, then collapse repeats
+        slug = _SLUG_NON_ALNUM_RE.sub('_', pattern_name.lower()).strip('_')
+        return _SLUG_UNDERSCORES_RE.sub('_', slug)
 
     def _validate_python_syntax(self, code: str) -> tuple[bool, Optional[str]]:
         """
@@ -389,13 +989,7 @@ class TestGenerator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        try:
-            ast.parse(code)
-            return True, None
-        except SyntaxError as e:
-            return False, f"Syntax error at line {e.lineno}: {e.msg}"
-        except Exception as e:
-            return False, f"Parse error: {str(e)}"
+        return _check_syntax(code)
 
     def _clean_claude_response(self, response: str) -> str:
         """
@@ -409,14 +1003,9 @@ class TestGenerator:
         """
         # Remove markdown code blocks if present
         response = response.strip()
-        if response.startswith('```'):
-            lines = response.split('\n')
-            # Remove first line (```python or ```)
-            lines = lines[1:]
-            # Remove last line (```)
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]
-            response = '\n'.join(lines)
+        match = _CODE_FENCE_RE.match(response)
+        if match:
+            response = match.group(1)
 
         return response.strip()
 
@@ -431,28 +1020,22 @@ class TestGenerator:
         Returns:
             Mock test code
         """
-        # Check for exact match first
+        # Exact match first, then partial matches (e.g., "silent_fallback_pattern"
+        # matches "silent_fallback"); a key contained in the slug also covers prefixes
         if pattern_slug in MOCK_TESTS:
-            template = MOCK_TESTS[pattern_slug]
-        # Check for partial matches (e.g., "silent_fallback_pattern" matches "silent_fallback")
+            key = pattern_slug
         else:
-            matched = False
-            for key in MOCK_TESTS:
-                if key != 'default' and (key in pattern_slug or pattern_slug.startswith(key)):
-                    template = MOCK_TESTS[key]
-                    matched = True
-                    break
-            if not matched:
-                template = MOCK_TESTS['default']
-
-        # Format template
-        return template.format(
-            pattern_title=pattern['name'],
-            pattern_slug=pattern_slug,
-            severity=pattern.get('impact', 'MEDIUM').upper(),
-            generated_date=datetime.now().strftime('%Y-%m-%d'),
-            description=pattern['description']
-        )
+            key = next((key for key in _MOCK_MATCH_KEYS if key in pattern_slug), 'default')
+        template = _MOCK_TEMPLATE_PARTS[key]
+
+        # Fill template
+        return _render_template(template, {
+            'pattern_title': pattern['name'],
+            'pattern_slug': pattern_slug,
+            'severity': pattern.get('impact', 'MEDIUM').upper(),
+            'generated_date': datetime.now().strftime('%Y-%m-%d'),
+            'description': pattern['description']
+        })
 
     def generate_test(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -474,6 +1057,9 @@ class TestGenerator:
                 - test_code: Generated Python code
                 - validation: Syntax validation result
                 - filename: Suggested filename
+                - pattern_hash: Fingerprint embedded in the written file, or None
+                - skipped: True when the existing file is unchanged (see
+                  generate_all_tests; test_code is None then)
         """
         pattern_name = pattern['name']
         pattern_slug = self._generate_pattern_slug(pattern_name)
@@ -481,36 +1067,59 @@ class TestGenerator:
         print(f"Generating test for: {pattern_name}...", file=sys.stderr)
 
         # Generate test code
+        pattern_hash = self._pattern_hash(pattern, pattern_slug)
+
         if self.mock:
             print(f"  Using mock template", file=sys.stderr)
             test_code = self._get_mock_template(pattern_slug, pattern)
-        else:
-            # Create prompt
-            prompt = TEST_GENERATION_PROMPT.format(
-                pattern_name=pattern_name,
-                pattern_slug=pattern_slug,
-                description=pattern['description'],
-                evidence='\n'.join(f"  - {e}" for e in pattern.get('evidence', [])),
-                frequency=pattern.get('frequency', 'unknown'),
-                impact=pattern.get('impact', 'medium'),
-                root_cause=pattern.get('root_cause', 'Unknown')
+            return self._build_result(pattern_name, pattern_slug, test_code, pattern_hash)
+
+        test_code = self._load_cached_test(pattern, pattern_slug)
+        if test_code is not None:
+            print(f"  Using cached test", file=sys.stderr)
+            return self._build_result(pattern_name, pattern_slug, test_code, pattern_hash)
+
+        # Create prompt
+        request = _TEST_GENERATION_SUFFIX.format(**self._prompt_fields(pattern, pattern_slug))
+
+        # Call Claude
+        try:
+            response = self._call_claude(request)
+
+            test_code = self._clean_claude_response(response)
+            print(f"  Generated {len(test_code)} characters", file=sys.stderr)
+        except Exception as e:
+            print(f"  Error generating test: {e}", file=sys.stderr)
+            print(f"  Falling back to mock template", file=sys.stderr)
+            return self._build_result(
+                pattern_name, pattern_slug, self._get_mock_template(pattern_slug, pattern)
             )
 
-            # Call Claude
-            try:
-                if self.use_cli:
-                    response = self._call_claude_cli(prompt)
-                else:
-                    response = self._call_claude_sdk(prompt)
+        result = self._build_result(pattern_name, pattern_slug, test_code, pattern_hash)
+        if result['validation']['is_valid']:
+            self._store_cached_test(pattern, pattern_slug, test_code)
+        return result
 
-                test_code = self._clean_claude_response(response)
-                print(f"  Generated {len(test_code)} characters", file=sys.stderr)
-            except Exception as e:
-                print(f"  Error generating test: {e}", file=sys.stderr)
-                print(f"  Falling back to mock template", file=sys.stderr)
-                test_code = self._get_mock_template(pattern_slug, pattern)
+    def _build_result(
+        self,
+        pattern_name: str,
+        pattern_slug: str,
+        test_code: str,
+        pattern_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate generated test code and package it as a generation result.
 
-        # Validate syntax
+        Args:
+            pattern_name: Original pattern name
+            pattern_slug: Slug for filename
+            test_code: Generated Python code
+            pattern_hash: Fingerprint to embed in the written file; None for
+                mock fallbacks, so they are regenerated on the next run
+
+        Returns:
+            Test generation result (see generate_test)
+        """
         is_valid, error = self._validate_python_syntax(test_code)
 
         if is_valid:
@@ -526,7 +1135,8 @@ class TestGenerator:
                 'is_valid': is_valid,
                 'error': error
             },
-            'filename': f"test_{pattern_slug}.py"
+            'filename': f"test_{pattern_slug}.py",
+            'pattern_hash': pattern_hash
         }
 
     def generate_all_tests(
@@ -536,17 +1146,153 @@ class TestGenerator:
         """
         Generate defeat tests for all patterns.
 
+        Claude calls are independent and I/O-bound, so up to `concurrency`
+        of them run at once on worker threads. When an output directory is
+        set, patterns whose existing test file carries the same pattern hash
+        are skipped (unless `force`) without a cache lookup or Claude call.
+
+        Args:
+            patterns: List of pattern dictionaries
+
+        Returns:
+            List of test generation results, in input order
+        """
+        if self.output_dir is None or self.force:
+            return self._generate_pending(patterns)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        pending = []
+        for pattern in patterns:
+            pattern_slug = self._generate_pattern_slug(pattern['name'])
+            pattern_hash = self._pattern_hash(pattern, pattern_slug)
+            filename = f"test_{pattern_slug}.py"
+            if _read_pattern_hash(self.output_dir / filename) == pattern_hash:
+                results.append({
+                    'pattern_name': pattern['name'],
+                    'pattern_slug': pattern_slug,
+                    'test_code': None,
+                    'validation': {'is_valid': True, 'error': None},
+                    'filename': filename,
+                    'pattern_hash': pattern_hash,
+                    'skipped': True
+                })
+            else:
+                results.append(None)
+                pending.append(pattern)
+
+        skipped = len(patterns) - len(pending)
+        if skipped:
+            print(f"Skipping {skipped} unchanged pattern(s) (use --force to regenerate)", file=sys.stderr)
+
+        generated = iter(self._generate_pending(pending) if pending else [])
+        return [result if result is not None else next(generated) for result in results]
+
+    def _generate_pending(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate tests for patterns that need it, batching and parallelizing calls.
+
         Args:
             patterns: List of pattern dictionaries
 
+        Returns:
+            List of test generation results, in input order
+        """
+        size = 1 if self.mock else self.batch_size
+        chunks = [patterns[start:start + size] for start in range(0, len(patterns), size)]
+
+        if self.mock or self.concurrency == 1 or len(chunks) == 1:
+            results = []
+            for start, chunk in zip(range(0, len(patterns), size), chunks):
+                position = str(start + 1) if len(chunk) == 1 else f"{start + 1}-{start + len(chunk)}"
+                print(f"\n[{position}/{len(patterns)}] ", file=sys.stderr, end='')
+                results.extend(self._generate_chunk(chunk))
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+            return [
+                result
+                for chunk_results in executor.map(self._generate_chunk, chunks)
+                for result in chunk_results
+            ]
+
+    def _generate_chunk(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate tests for one unit of work: a batch, or a single pattern.
+
+        Args:
+            patterns: Patterns sharing one Claude call
+
         Returns:
             List of test generation results
         """
+        if self.mock or self.batch_size == 1:
+            return [self.generate_test(pattern) for pattern in patterns]
+        return self.generate_batch(patterns)
+
+    def generate_batch(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate defeat tests for several patterns with a single Claude call.
+
+        Cached patterns are left out of the call. Patterns missing from the
+        response fall back to mock templates, as generate_test does when a
+        call fails.
+
+        Args:
+            patterns: List of pattern dictionaries
+
+        Returns:
+            List of test generation results, in input order
+        """
+        slugs = [self._generate_pattern_slug(pattern['name']) for pattern in patterns]
+        print(
+            f"Generating tests for: {', '.join(pattern['name'] for pattern in patterns)}...",
+            file=sys.stderr
+        )
+
+        cached = [self._load_cached_test(pattern, slug) for pattern, slug in zip(patterns, slugs)]
+        pending = [
+            (pattern, slug)
+            for pattern, slug, test_code in zip(patterns, slugs, cached)
+            if test_code is None
+        ]
+
+        blocks = {}
+        if pending:
+            try:
+                response = self._call_claude(
+                    self._build_batch_prompt(
+                        [pattern for pattern, _ in pending], [slug for _, slug in pending]
+                    ),
+                    len(pending)
+                )
+                blocks = self._split_batch_response(response)
+            except Exception as e:
+                print(f"  Error generating tests: {e}", file=sys.stderr)
+
         results = []
+        for pattern, slug, test_code in zip(patterns, slugs, cached):
+            if test_code is not None:
+                print(f"  Using cached test for {pattern['name']}", file=sys.stderr)
+                results.append(
+                    self._build_result(pattern['name'], slug, test_code, self._pattern_hash(pattern, slug))
+                )
+                continue
+
+            test_code = blocks.get(f"test_{slug}.py")
+            if test_code is None:
+                print(
+                    f"  No test returned for {pattern['name']}, falling back to mock template",
+                    file=sys.stderr
+                )
+                results.append(
+                    self._build_result(pattern['name'], slug, self._get_mock_template(slug, pattern))
+                )
+                continue
 
-        for i, pattern in enumerate(patterns, 1):
-            print(f"\n[{i}/{len(patterns)}] ", file=sys.stderr, end='')
-            result = self.generate_test(pattern)
+            print(f"  Generated {len(test_code)} characters for {pattern['name']}", file=sys.stderr)
+            result = self._build_result(pattern['name'], slug, test_code, self._pattern_hash(pattern, slug))
+            if result['validation']['is_valid']:
+                self._store_cached_test(pattern, slug, test_code)
             results.append(result)
 
         return results
@@ -569,9 +1315,13 @@ class TestGenerator:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        written_files = []
+        to_write = []
 
         for result in results:
+            if result.get('skipped'):
+                print(f"Unchanged: {output_dir / result['filename']}", file=sys.stderr)
+                continue
+
             if not result['validation']['is_valid']:
                 print(
                     f"Skipping {result['filename']}: syntax validation failed",
@@ -579,24 +1329,146 @@ class TestGenerator:
                 )
                 continue
 
-            filepath = output_dir / result['filename']
-            filepath.write_text(result['test_code'])
-            filepath.chmod(0o755)  # Make executable
+            to_write.append((
+                output_dir / result['filename'],
+                _embed_pattern_hash(result['test_code'], result.get('pattern_hash'))
+            ))
+
+        # File writes are IO-bound, so overlap them; map keeps result order
+        with ThreadPoolExecutor(max_workers=WRITE_CONCURRENCY) as executor:
+            written_files = list(executor.map(lambda item: _write_executable(*item), to_write))
 
-            written_files.append(filepath)
+        for filepath in written_files:
             print(f"Wrote: {filepath}", file=sys.stderr)
 
         return written_files
 
 
-def main():
-    """Main entry point for CLI usage."""
+def _embed_pattern_hash(test_code: str, pattern_hash: Optional[str]) -> str:
+    """
+    Add the pattern-hash comment after the shebang line (or first, if none).
+
+    Args:
+        test_code: Generated test code
+        pattern_hash: Fingerprint from TestGenerator._pattern_hash, or None
+
+    Returns:
+        Test code with the comment, or unchanged if there is no hash
+    """
+    if not pattern_hash:
+        return test_code
+    line = f"{PATTERN_HASH_PREFIX}{pattern_hash}\n"
+    if test_code.startswith('#!'):
+        first, sep, rest = test_code.partition('\n')
+        return f"{first}\n{line}{rest}" if sep else f"{first}\n{line}"
+    return line + test_code
+
+
+def _read_pattern_hash(filepath: Path) -> Optional[str]:
+    """
+    Read the pattern hash from the head of an existing test file.
+
+    Only the first bytes are read: the comment is on the first or second line.
+
+    Args:
+        filepath: Test file path
+
+    Returns:
+        Embedded hash, or None if the file is missing or has none
+    """
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        head = os.read(fd, 256).decode('utf-8', errors='replace')
+    finally:
+        os.close(fd)
+    match = _PATTERN_HASH_RE.search('\n'.join(head.split('\n', 2)[:2]))
+    return match.group(1) if match else None
+
+
+def _write_executable(filepath: Path, text: str) -> Path:
+    """
+    Write text to an executable file with raw os calls (no TextIOWrapper).
+
+    Args:
+        filepath: File to create or overwrite
+        text: File contents
+
+    Returns:
+        filepath
+    """
+    data = text.encode('utf-8')
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # Creation mode is masked by umask and ignored for existing files
+        os.fchmod(fd, 0o755)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return filepath
+
+
+def _validation_cache_path() -> Path:
+    """Location of the --validate-only verdict cache (under PATTERN_CACHE_DIR)."""
+    return Path(
+        os.environ.get('PATTERN_CACHE_DIR', '~/.cache/pattern-detector')
+    ).expanduser() / VALIDATION_CACHE_FILE
+
+
+def _load_validation_cache(path: Path) -> Dict[str, List[Any]]:
+    """
+    Load cached syntax verdicts.
+
+    Args:
+        path: Cache file
+
+    Returns:
+        Mapping of cache key to [is_valid, error]; empty if missing or unreadable
+    """
+    try:
+        with open(path, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_validation_cache(path: Path, cache: Dict[str, List[Any]]):
+    """
+    Write syntax verdicts atomically so concurrent runs never see partial files.
+
+    Args:
+        path: Cache file
+        cache: Mapping of cache key to [is_valid, error]
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', dir=path.parent, suffix='.tmp', delete=False
+        ) as f:
+            json.dump(cache, f)
+        os.replace(f.name, path)
+    except OSError as e:
+        print(f"Warning: Failed to write validation cache: {e}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Generate defeat tests from pattern analysis.'
     )
     parser.add_argument(
         '--input',
-        help='Input JSON file from analyze.py (default: read from stdin)'
+        help='Input JSON file from analyze.py, or - for stdin (default: read from stdin)'
     )
     parser.add_argument(
         '--output-dir',
@@ -617,18 +1489,54 @@ def main():
         '--api-key',
         help='Anthropic API key (default: use ANTHROPIC_API_KEY env var)'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=PATTERNS_PER_CALL,
+        help=f'Patterns to generate per Claude call (default: {PATTERNS_PER_CALL}; 1 = one call per pattern)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=GENERATION_CONCURRENCY,
+        help=f'Claude calls to run in parallel (default: {GENERATION_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Make one Claude call at a time (same as --concurrency 1; for debugging)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call Claude, ignoring tests cached for identical patterns'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for cached tests (default: ~/.cache/pattern-detector/tests)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate tests even when the existing file matches the pattern hash'
+    )
     parser.add_argument(
         '--validate-only',
         action='store_true',
         help='Only validate existing tests, do not generate new ones'
     )
+    parser.add_argument(
+        '--no-validation-cache',
+        action='store_true',
+        help='Re-parse every test in --validate-only mode instead of reusing cached verdicts'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
         help='Generate tests but do not write files'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Validate-only mode
@@ -645,9 +1553,22 @@ def main():
             generator = TestGenerator()
             invalid_count = 0
 
+            # Unchanged files reuse their verdict instead of being re-parsed.
+            # Keys include the Python version, since valid syntax depends on it.
+            cache_path = _validation_cache_path()
+            cache = {} if args.no_validation_cache else _load_validation_cache(cache_path)
+            version = '%d.%d' % sys.version_info[:2]
+            cache_changed = False
+
             for test_file in test_files:
-                code = test_file.read_text()
-                is_valid, error = generator._validate_python_syntax(code)
+                code_bytes = test_file.read_bytes()
+                key = f"{version}:{hashlib.sha1(code_bytes).hexdigest()}"
+                if key in cache:
+                    is_valid, error = cache[key]
+                else:
+                    is_valid, error = generator._validate_python_syntax(code_bytes.decode('utf-8'))
+                    cache[key] = [is_valid, error]
+                    cache_changed = True
 
                 if is_valid:
                     print(f"✓ {test_file.name}", file=sys.stderr)
@@ -655,6 +1576,9 @@ def main():
                     print(f"✗ {test_file.name}: {error}", file=sys.stderr)
                     invalid_count += 1
 
+            if cache_changed and not args.no_validation_cache:
+                _save_validation_cache(cache_path, cache)
+
             if invalid_count > 0:
                 print(f"\n{invalid_count} test(s) failed validation", file=sys.stderr)
                 return 1
@@ -663,11 +1587,11 @@ def main():
                 return 0
 
         # Read input patterns
-        if args.input:
-            with open(args.input, 'r') as f:
-                data = json.load(f)
+        if args.input and args.input != '-':
+            with open(args.input, 'rb') as f:
+                data = _loads(f.read())
         else:
-            data = json.load(sys.stdin)
+            data = _loads(_read_stdin())
 
         patterns = data.get('patterns', [])
 
@@ -681,7 +1605,13 @@ def main():
         generator = TestGenerator(
             api_key=args.api_key,
             use_cli=not args.use_sdk,
-            mock=args.mock
+            mock=args.mock,
+            batch_size=args.batch_size,
+            concurrency=1 if args.sequential else args.concurrency,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+            output_dir=args.output_dir,
+            force=args.force
         )
 
         # Generate tests
@@ -690,11 +1620,14 @@ def main():
         # Summary
         valid_count = sum(1 for r in results if r['validation']['is_valid'])
         invalid_count = len(results) - valid_count
+        unchanged_count = sum(1 for r in results if r.get('skipped'))
 
         print(f"\n=== Generation Summary ===", file=sys.stderr)
         print(f"Total patterns: {len(patterns)}", file=sys.stderr)
         print(f"Valid tests: {valid_count}", file=sys.stderr)
         print(f"Invalid tests: {invalid_count}", file=sys.stderr)
+        if unchanged_count:
+            print(f"Unchanged (skipped): {unchanged_count}", file=sys.stderr)
 
         # Write files (unless dry-run)
         if not args.dry_run:
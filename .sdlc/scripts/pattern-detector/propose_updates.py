@@ -34,39 +34,106 @@ Output:
 """
 
 import argparse
+import hashlib
+import importlib.util
+import io
 import json
 import os
-import subprocess
+import re
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
 
-# Template for generating proposals using Claude
-PROPOSAL_GENERATION_PROMPT = """You are an expert in software development best practices and agent prompt engineering. You are helping improve AI agent character sheets based on identified anti-patterns.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
 
-**Pattern Detected:**
-{pattern_json}
 
-**Agent Type:** {agent_type}
+def _read_stdin() -> Union[bytes, str]:
+    """
+    Read all of stdin for _loads.
+
+    Returns bytes from the binary buffer when there is one; a substituted
+    text stream without one (e.g. io.StringIO) is read as str.
+    """
+    buffer = getattr(sys.stdin, 'buffer', None)
+    return buffer.read() if buffer is not None else sys.stdin.read()
+
+
+def _dumps_indented(obj: Any) -> str:
+    """
+    Serialize to JSON text with 2-space indentation.
+
+    Uses orjson when available. The stdlib fallback keeps non-ASCII characters
+    unescaped so both produce identical text.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
-**Your Task:**
-Generate three specific, actionable updates to the {agent_type} agent's character sheet to prevent this pattern from recurring:
 
-1. **Non-Negotiable Test Entry**: A checklist item for what to ALWAYS verify/check (1 line, starts with "NEVER" or "ALWAYS")
+def _write_json(results: Dict[str, Any], path: Optional[str], pretty: bool = False):
+    """
+    Serialize results straight to a file or stdout without an intermediate str.
+
+    orjson produces bytes that are written as-is; the stdlib fallback streams
+    through json.dump.
+
+    Args:
+        results: Results to serialize
+        path: Output file path, or None for stdout
+        pretty: Indent the JSON output
+    """
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if path:
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b'\n')
+            sys.stdout.buffer.flush()
+    else:
+        options = {'indent': 2} if pretty else {'separators': (',', ':')}
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, **options)
+        else:
+            json.dump(results, sys.stdout, **options)
+            sys.stdout.write('\n')
+
+
+# Prompt sections shared by the single-pattern and batch prompts
+_PROMPT_INTRO = (
+    "You are an expert in software development best practices and agent prompt engineering. "
+    "You are helping improve AI agent character sheets based on identified anti-patterns."
+)
+
+_PROMPT_UPDATE_ITEMS = """1. **Non-Negotiable Test Entry**: A checklist item for what to ALWAYS verify/check (1 line, starts with "NEVER" or "ALWAYS")
 2. **Discipline Item**: A procedural step for what to do before/during coding (1-2 lines, actionable)
-3. **Memory Entry**: A concise learning statement (1 sentence, starts with "Learned:")
+3. **Memory Entry**: A concise learning statement (1 sentence, starts with "Learned:")"""
 
-**Output Format** (return ONLY valid JSON, no markdown):
-{{
+_PROMPT_EXAMPLE = """{
   "non_negotiable": "- [ ] NEVER use .get(key, default) without explicit validation",
   "discipline": "Before using dictionary access, verify the key exists or handle missing explicitly",
   "memory": "Learned: Silent fallbacks hide bugs. Always validate explicitly.",
   "memory_tags": ["anti-patterns", "defeat-test", "pattern-name"]
-}}
+}"""
 
-**Guidelines:**
+_PROMPT_GUIDELINES = """**Guidelines:**
 - Be specific and actionable
 - Reference the pattern by name in memory tags
 - Use imperative language for discipline items
@@ -74,6 +141,70 @@ Generate three specific, actionable updates to the {agent_type} agent's characte
 - Memory should capture the core lesson learned
 """
 
+
+def _build_prompt(pattern_json: str, agent_type: str) -> str:
+    """
+    Prompt for generating a proposal using Claude.
+
+    An f-string, so no format string is parsed at call time.
+
+    Args:
+        pattern_json: Pattern fields serialized as JSON
+        agent_type: Target agent name (Dev, Research, etc.)
+
+    Returns:
+        Prompt text
+    """
+    return f"""{_PROMPT_INTRO}
+
+**Pattern Detected:**
+{pattern_json}
+
+**Agent Type:** {agent_type}
+
+**Your Task:**
+Generate three specific, actionable updates to the {agent_type} agent's character sheet to prevent this pattern from recurring:
+
+{_PROMPT_UPDATE_ITEMS}
+
+**Output Format** (return ONLY valid JSON, no markdown):
+{_PROMPT_EXAMPLE}
+
+{_PROMPT_GUIDELINES}"""
+
+
+def _build_batch_prompt(entries: List[Tuple[str, str]]) -> str:
+    """
+    Prompt asking for proposals for several patterns in one Claude call.
+
+    Args:
+        entries: (pattern_json, agent_type) for each pattern, in order
+
+    Returns:
+        Prompt text requesting a JSON array with one proposal per pattern
+    """
+    patterns = '\n'.join(
+        f"### Pattern {i} (Agent Type: {agent_type})\n{pattern_json}\n"
+        for i, (pattern_json, agent_type) in enumerate(entries, 1)
+    )
+    return f"""{_PROMPT_INTRO}
+
+**Patterns Detected ({len(entries)}):**
+
+{patterns}
+**Your Task:**
+For EACH pattern, generate three specific, actionable updates to its agent's character sheet to prevent the pattern from recurring:
+
+{_PROMPT_UPDATE_ITEMS}
+
+**Output Format** (return ONLY a valid JSON array of exactly {len(entries)} objects, one per pattern in the order given, no markdown):
+[
+{_PROMPT_EXAMPLE}
+]
+
+{_PROMPT_GUIDELINES}"""
+
+
 # Agent type mapping based on pattern characteristics
 AGENT_TYPE_RULES = [
     # Code patterns -> Dev agent
@@ -113,8 +244,40 @@ AGENT_TYPE_RULES = [
     }
 ]
 
-# Mock proposals for testing without API calls
-MOCK_PROPOSALS = {
+# AGENT_TYPE_RULES prepared once: (keywords, score per matched keyword, agent,
+# highest score any later rule can reach). Keywords match as substrings (so
+# "exceptions" counts for "exception").
+_AGENT_RULE_MATCHERS = [
+    (
+        tuple(rule['keywords']),
+        4 - rule['priority'],
+        rule['agent'],
+        max((len(later['keywords']) * (4 - later['priority'])
+             for later in AGENT_TYPE_RULES[i + 1:]), default=0)
+    )
+    for i, rule in enumerate(AGENT_TYPE_RULES)
+]
+
+# Characters dropped from defeat test names: anything str.isalnum() rejects except '_'
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Claude calls in flight at once
+PROPOSAL_CONCURRENCY = 4
+
+# Patterns sent to Claude per call (1 = one call per pattern)
+PROPOSALS_PER_CALL = 5
+
+# Response budget per proposal (SDK only); a batch call gets one per pattern
+PROPOSAL_MAX_TOKENS = 1000
+
+# Seconds allowed per proposal (CLI only); a batch call gets one per pattern
+PROPOSAL_TIMEOUT = 60
+
+# Claude CLI command line; `claude -p` reads the prompt from stdin when none is given
+CLAUDE_CLI_ARGV = ('claude', '-p')
+
+# Mock proposals for testing without API calls (read-only; callers get copies)
+MOCK_PROPOSALS = MappingProxyType({
     "Silent Fallback Pattern": {
         "agent": "Dev",
         "non_negotiable": "- [ ] NEVER use .get(key, default) without explicit validation",
@@ -136,24 +299,86 @@ MOCK_PROPOSALS = {
         "memory": "Learned: Mixed path handling causes failures in different execution contexts. Standardize on absolute paths.",
         "memory_tags": ["anti-patterns", "defeat-test", "path-handling"]
     }
-}
+})
 
 
 class ProposalGenerator:
     """Generates agent prompt update proposals from identified patterns."""
 
-    def __init__(self, api_key: Optional[str] = None, use_cli: bool = True, mock: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_cli: Optional[bool] = None,
+        mock: bool = False,
+        concurrency: int = PROPOSAL_CONCURRENCY,
+        batch_size: int = PROPOSALS_PER_CALL,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize proposal generator.
 
         Args:
             api_key: Anthropic API key (optional if using CLI or environment variable)
-            use_cli: Use Claude CLI instead of Python SDK (default: True)
+            use_cli: Use Claude CLI instead of Python SDK (default: auto - SDK when
+                the anthropic package and an API key are available, CLI otherwise)
             mock: Use mock data instead of real API calls (default: False)
+            concurrency: Claude calls to run in parallel, 1 for sequential
+                (default: PROPOSAL_CONCURRENCY)
+            batch_size: Patterns to send per Claude call (default: PROPOSALS_PER_CALL)
+            use_cache: Reuse proposals cached for identical prompts (default: True)
+            cache_dir: Directory for cached proposals (default: proposals/ under
+                PATTERN_CACHE_DIR, or ~/.cache/pattern-detector/proposals)
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        if use_cli is None:
+            # Prefer the SDK's pooled HTTP connection over spawning a CLI process per call
+            # find_spec only locates the SDK; importing it is left to the first SDK call
+            use_cli = importlib.util.find_spec('anthropic') is None or not self.api_key
         self.use_cli = use_cli
         self.mock = mock
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else Path(
+            os.environ.get('PATTERN_CACHE_DIR', '~/.cache/pattern-detector')
+        ).expanduser() / 'proposals'
+        self._memo: Dict[str, Dict[str, Any]] = {}  # In-process layer over the disk cache
+        self._sdk_client = None
+        self._sdk_lock = threading.Lock()
+        self._run_date: Optional[str] = None  # Set by generate_proposals
+
+    @property
+    def _sdk(self):
+        """
+        Anthropic client, created on first use and shared by all calls.
+
+        Concurrent proposal threads reuse its HTTP connection pool, so each
+        call after the first skips the TCP/TLS handshake.
+
+        Raises:
+            ImportError: If anthropic SDK is not installed
+            ValueError: If no API key is available
+        """
+        with self._sdk_lock:
+            if self._sdk_client is None:
+                # Imported here so mock/CLI runs and --help never load the SDK
+                try:
+                    import anthropic
+                except ImportError:
+                    raise ImportError(
+                        "anthropic SDK not installed. Install with: pip install anthropic\n"
+                        "Or use --use-cli flag to use the Claude CLI instead."
+                    )
+
+                if not self.api_key:
+                    raise ValueError(
+                        "ANTHROPIC_API_KEY environment variable not set and no API key provided"
+                    )
+
+                self._sdk_client = anthropic.Anthropic(api_key=self.api_key)
+
+        return self._sdk_client
 
     def classify_pattern_agent(self, pattern: Dict[str, Any]) -> str:
         """
@@ -167,56 +392,67 @@ class ProposalGenerator:
         """
         pattern_text = f"{pattern.get('name', '')} {pattern.get('description', '')} {pattern.get('root_cause', '')}".lower()
 
-        # Score each agent type
-        scores = []
-        for rule in AGENT_TYPE_RULES:
-            keyword_matches = sum(1 for kw in rule['keywords'] if kw in pattern_text)
+        # Score each agent type; map(str.__contains__) counts matches in C.
+        # Keep the highest (score, agent); ties go to the greater name.
+        best = None
+        for keywords, weight, agent, later_max in _AGENT_RULE_MATCHERS:
+            keyword_matches = sum(map(pattern_text.__contains__, keywords))
             if keyword_matches > 0:
                 # Higher priority (lower number) gets bonus
-                score = keyword_matches * (4 - rule['priority'])
-                scores.append((score, rule['agent']))
+                score = (keyword_matches * weight, agent)
+                if best is None or score > best:
+                    best = score
+            if best is not None and best[0] > later_max:
+                break  # No remaining rule can catch up
+
+        # Default to Dev if no matches
+        return best[1] if best is not None else 'Dev'
+
+    def _call_claude(self, prompt: str, count: int = 1) -> str:
+        """
+        Call Claude via the CLI or SDK, whichever this generator uses.
+
+        Args:
+            prompt: Prompt text
+            count: Proposals the prompt asks for; scales the time and token budget
+
+        Returns:
+            Raw response text
+        """
+        if self.use_cli:
+            return self._call_claude_cli(prompt, timeout=PROPOSAL_TIMEOUT * count)
+        return self._call_claude_sdk(prompt, max_tokens=PROPOSAL_MAX_TOKENS * count)
+
+    def _call_claude_cli(self, prompt: str, timeout: int = PROPOSAL_TIMEOUT) -> str:
+        """
+        Call Claude using the CLI.
 
-        # Return agent with highest score, default to Dev if no matches
-        if scores:
-            scores.sort(reverse=True)
-            return scores[0][1]
-        return 'Dev'
+        The prompt is piped through stdin rather than passed as an argument,
+        so a large batch prompt cannot exceed the OS argument size limit.
+        """
+        # Only the CLI path needs this; mock/SDK runs and --help skip the import
+        import subprocess
 
-    def _call_claude_cli(self, prompt: str) -> str:
-        """Call Claude using the CLI."""
         try:
             result = subprocess.run(
-                ['claude', '-p', prompt],
+                CLAUDE_CLI_ARGV,
+                input=prompt,
                 capture_output=True,
                 text=True,
                 check=True,
-                timeout=60
+                timeout=timeout
             )
             return result.stdout.strip()
         except subprocess.TimeoutExpired:
-            raise Exception("Claude CLI call timed out after 60 seconds")
+            raise Exception(f"Claude CLI call timed out after {timeout} seconds")
         except subprocess.CalledProcessError as e:
             raise Exception(f"Claude CLI call failed: {e.stderr}")
 
-    def _call_claude_sdk(self, prompt: str) -> str:
+    def _call_claude_sdk(self, prompt: str, max_tokens: int = PROPOSAL_MAX_TOKENS) -> str:
         """Call Claude using the Python SDK."""
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError(
-                "anthropic SDK not installed. Install with: pip install anthropic\n"
-                "Or use --use-cli flag to use the Claude CLI instead."
-            )
-
-        if not self.api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY environment variable not set and no API key provided"
-            )
-
-        client = anthropic.Anthropic(api_key=self.api_key)
-        response = client.messages.create(
+        response = self._sdk.messages.create(
             model="claude-sonnet-4-5-20250929",
-            max_tokens=1000,
+            max_tokens=max_tokens,
             messages=[
                 {
                     "role": "user",
@@ -227,17 +463,89 @@ class ProposalGenerator:
 
         return response.content[0].text
 
-    def _parse_claude_response(self, response: str) -> Dict[str, Any]:
-        """Parse Claude's JSON response."""
+    def _load_cached_proposal(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the proposal cached for an identical prompt.
+
+        Args:
+            key: SHA-256 of the prompt
+
+        Returns:
+            Copy of the cached proposal, or None on a miss or caching disabled
+        """
+        if not self.use_cache:
+            return None
+
+        proposal = self._memo.get(key)
+        if proposal is None:
+            try:
+                proposal = json.loads((self.cache_dir / f"{key}.json").read_text())
+            except (OSError, ValueError):
+                return None
+            if not isinstance(proposal, dict):
+                return None
+            self._memo[key] = proposal
+
+        # Callers tag proposals with agent/pattern fields; keep the cached copy clean
+        return dict(proposal)
+
+    def _store_cached_proposal(self, key: str, proposal: Dict[str, Any]):
+        """
+        Cache a proposal, writing atomically so readers never see partial files.
+
+        Args:
+            key: SHA-256 of the prompt
+            proposal: Parsed proposal from Claude
+        """
+        if not self.use_cache or not isinstance(proposal, dict):
+            return
+
+        # Only cache writes need this; mock runs and --help skip the import
+        import tempfile
+
+        self._memo[key] = dict(proposal)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as f:
+                json.dump(proposal, f)
+            os.replace(f.name, self.cache_dir / f"{key}.json")
+        except OSError as e:
+            print(f"Warning: Failed to write proposal cache: {e}", file=sys.stderr)
+
+    def _parse_claude_response(self, response: str) -> Any:
+        """Parse Claude's JSON response (an object, or an array for a batch)."""
         response = response.strip()
+        if response[:1] == '{':
+            # Bare JSON, the usual case: parse without touching the text
+            return _loads(response)
+
         if response.startswith('```'):
-            lines = response.split('\n')
-            lines = lines[1:]
-            if lines[-1].strip() == '```':
-                lines = lines[:-1]
-            response = '\n'.join(lines)
+            # Drop the opening fence line (``` or ```json) and any closing fence
+            response = response.partition('\n')[2].rstrip().removesuffix('```')
+
+        return _loads(response)
+
+    def _pattern_json(self, pattern: Dict[str, Any]) -> str:
+        """Serialize the pattern fields a prompt shows Claude."""
+        return json.dumps({
+            'name': pattern.get('name'),
+            'description': pattern.get('description'),
+            'impact': pattern.get('impact'),
+            'frequency': pattern.get('frequency'),
+            'root_cause': pattern.get('root_cause')
+        }, indent=2)
+
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Cache key for a single-pattern prompt.
 
-        return json.loads(response)
+        The prompt embeds the template, pattern fields and agent, so it is the
+        key. Batched proposals are cached under the same keys, so a pattern
+        hits the cache whichever way it was generated.
+        """
+        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
 
     def generate_proposal(self, pattern: Dict[str, Any], agent: str) -> Dict[str, Any]:
         """
@@ -254,7 +562,8 @@ class ProposalGenerator:
             # Use mock proposals
             pattern_name = pattern.get('name', '')
             if pattern_name in MOCK_PROPOSALS:
-                return MOCK_PROPOSALS[pattern_name]
+                # Copy: generate_proposals tags the result with agent/pattern fields
+                return dict(MOCK_PROPOSALS[pattern_name])
             # Generic fallback for mock mode
             return {
                 "non_negotiable": f"- [ ] ALWAYS check for {pattern_name} pattern",
@@ -264,26 +573,17 @@ class ProposalGenerator:
             }
 
         # Generate proposal using Claude
-        pattern_json = json.dumps({
-            'name': pattern.get('name'),
-            'description': pattern.get('description'),
-            'impact': pattern.get('impact'),
-            'frequency': pattern.get('frequency'),
-            'root_cause': pattern.get('root_cause')
-        }, indent=2)
-
-        prompt = PROPOSAL_GENERATION_PROMPT.format(
-            pattern_json=pattern_json,
-            agent_type=agent
-        )
+        prompt = _build_prompt(self._pattern_json(pattern), agent)
+        cache_key = self._cache_key(prompt)
+        proposal = self._load_cached_proposal(cache_key)
+        if proposal is not None:
+            return proposal
 
         try:
-            if self.use_cli:
-                response = self._call_claude_cli(prompt)
-            else:
-                response = self._call_claude_sdk(prompt)
+            response = self._call_claude(prompt)
 
             proposal = self._parse_claude_response(response)
+            self._store_cached_proposal(cache_key, proposal)
             return proposal
 
         except Exception as e:
@@ -296,6 +596,62 @@ class ProposalGenerator:
                 "memory_tags": ["anti-patterns", "defeat-test", "auto-generated"]
             }
 
+    def generate_proposals_batch(self, items: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """
+        Generate proposals for several patterns with a single Claude call.
+
+        Cached patterns are left out of the call. If the call fails or the
+        response is not a JSON array with one object per pattern, each
+        pattern falls back to its own generate_proposal call.
+
+        Args:
+            items: (pattern, agent) pairs
+
+        Returns:
+            List of proposal dictionaries, in input order
+        """
+        prompts = [_build_prompt(self._pattern_json(pattern), agent) for pattern, agent in items]
+        keys = [self._cache_key(prompt) for prompt in prompts]
+        proposals = [self._load_cached_proposal(key) for key in keys]
+        pending = [i for i, proposal in enumerate(proposals) if proposal is None]
+        if not pending:
+            return proposals
+
+        batch = None
+        if len(pending) > 1:
+            try:
+                response = self._call_claude(
+                    _build_batch_prompt([
+                        (self._pattern_json(items[i][0]), items[i][1]) for i in pending
+                    ]),
+                    len(pending)
+                )
+                batch = self._parse_claude_response(response)
+                if not (
+                    isinstance(batch, list)
+                    and len(batch) == len(pending)
+                    and all(isinstance(proposal, dict) for proposal in batch)
+                ):
+                    raise ValueError(f"expected a JSON array of {len(pending)} proposals")
+            except Exception as e:
+                names = ', '.join(str(items[i][0].get('name')) for i in pending)
+                print(
+                    f"Warning: Batch proposal failed for {names}: {e}; "
+                    f"falling back to one call per pattern",
+                    file=sys.stderr
+                )
+                batch = None
+
+        if batch is None:
+            for i in pending:
+                proposals[i] = self.generate_proposal(*items[i])
+            return proposals
+
+        for i, proposal in zip(pending, batch):
+            self._store_cached_proposal(keys[i], proposal)
+            proposals[i] = proposal
+        return proposals
+
     def generate_defeat_test_name(self, pattern: Dict[str, Any]) -> str:
         """
         Generate standardized defeat test filename from pattern name.
@@ -306,87 +662,106 @@ class ProposalGenerator:
         Returns:
             Test filename (e.g., "test_no_silent_fallbacks.py")
         """
-        name = pattern.get('name', 'unknown_pattern')
-        # Convert to snake_case
-        name = name.lower()
-        name = name.replace(' ', '_')
-        # Remove special characters
-        name = ''.join(c if c.isalnum() or c == '_' else '' for c in name)
-        return f"test_no_{name}.py"
-
-    def format_proposal_markdown(self, patterns: List[Dict[str, Any]], proposals: List[Dict[str, Any]]) -> str:
+        # Convert to snake_case, then remove special characters in one regex pass
+        name = pattern.get('name', 'unknown_pattern').lower().replace(' ', '_')
+        return f"test_no_{_NON_WORD_RE.sub('', name)}.py"
+
+    def format_proposal_markdown(
+        self,
+        patterns: List[Dict[str, Any]],
+        proposals: List[Dict[str, Any]],
+        date: Optional[str] = None
+    ) -> str:
         """
         Format proposals as reviewable markdown.
 
         Args:
             patterns: List of pattern dictionaries from analyze.py
             proposals: List of generated proposal dictionaries
+            date: Run date for the title, YYYY-MM-DD (default: today)
 
         Returns:
             Formatted markdown string
         """
-        date = datetime.now().strftime('%Y-%m-%d')
-        lines = [
-            f"# Pattern Proposals - {date}",
-            "",
-            "This document contains proposed updates to agent character sheets based on detected patterns.",
-            "Review each proposal and decide whether to apply it to the corresponding agent.",
-            "",
-            "---",
-            ""
-        ]
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+
+        # Sections are written straight into one growing buffer
+        buf = io.StringIO()
+        buf.write(
+            f"# Pattern Proposals - {date}\n"
+            "\n"
+            "This document contains proposed updates to agent character sheets based on detected patterns.\n"
+            "Review each proposal and decide whether to apply it to the corresponding agent.\n"
+            "\n"
+            "---\n"
+        )
 
         for pattern, proposal in zip(patterns, proposals):
             impact = pattern.get('impact', 'unknown').upper()
             score = pattern.get('score', 0.0)
             agent = proposal.get('agent', 'Unknown')
 
-            lines.extend([
-                f"## Pattern: {pattern.get('name')} (Score: {score:.1f}, {impact} impact)",
-                "",
-                f"**Description:** {pattern.get('description')}",
-                "",
-                f"**Frequency:** {pattern.get('frequency')}",
-                "",
-                f"**Root Cause:** {pattern.get('root_cause')}",
-                "",
-                "**Evidence:**",
-            ])
-
-            for evidence in pattern.get('evidence', []):
-                lines.append(f"- {evidence}")
-
-            lines.extend([
-                "",
-                f"### Proposed Update for Agent: {agent}",
-                "",
-                "#### Non-Negotiable Addition",
-                "```",
-                proposal.get('non_negotiable', ''),
-                "```",
-                "",
-                "#### Discipline Item",
-                "```",
-                proposal.get('discipline', ''),
-                "```",
-                "",
-                "#### Memory Entry",
-                "```json",
-                json.dumps({
-                    "content": proposal.get('memory', ''),
-                    "category": "anti-patterns",
-                    "tags": proposal.get('memory_tags', [])
-                }, indent=2),
-                "```",
-                "",
-                "#### Related Defeat Test",
-                f"`{self.generate_defeat_test_name(pattern)}`",
-                "",
-                "---",
-                ""
-            ])
-
-        return '\n'.join(lines)
+            buf.write(
+                f"\n## Pattern: {pattern.get('name')} (Score: {score:.1f}, {impact} impact)\n"
+                "\n"
+                f"**Description:** {pattern.get('description')}\n"
+                "\n"
+                f"**Frequency:** {pattern.get('frequency')}\n"
+                "\n"
+                f"**Root Cause:** {pattern.get('root_cause')}\n"
+                "\n"
+                "**Evidence:**\n"
+            )
+
+            buf.writelines(f"- {evidence}\n" for evidence in pattern.get('evidence', []))
+
+            memory_json = _dumps_indented({
+                "content": proposal.get('memory', ''),
+                "category": "anti-patterns",
+                "tags": proposal.get('memory_tags', [])
+            })
+
+            buf.write(
+                "\n"
+                f"### Proposed Update for Agent: {agent}\n"
+                "\n"
+                "#### Non-Negotiable Addition\n"
+                "```\n"
+                f"{proposal.get('non_negotiable', '')}\n"
+                "```\n"
+                "\n"
+                "#### Discipline Item\n"
+                "```\n"
+                f"{proposal.get('discipline', '')}\n"
+                "```\n"
+                "\n"
+                "#### Memory Entry\n"
+                "```json\n"
+                f"{memory_json}\n"
+                "```\n"
+                "\n"
+                "#### Related Defeat Test\n"
+                f"`{self.generate_defeat_test_name(pattern)}`\n"
+                "\n"
+                "---\n"
+            )
+
+        return buf.getvalue()
+
+    def _generate_chunk(self, items: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """
+        Generate proposals for one unit of work: a batch, or a single pattern.
+
+        Args:
+            items: (pattern, agent) pairs sharing one Claude call
+
+        Returns:
+            List of proposal dictionaries
+        """
+        if self.mock or len(items) == 1:
+            return [self.generate_proposal(pattern, agent) for pattern, agent in items]
+        return self.generate_proposals_batch(items)
 
     def generate_proposals(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -398,27 +773,48 @@ class ProposalGenerator:
         Returns:
             Dictionary with proposals and metadata
         """
+        # One date for the whole run, so the title and output filename agree
+        # even if generation crosses midnight
+        self._run_date = datetime.now().strftime('%Y-%m-%d')
+
         patterns = analysis.get('patterns', [])
         print(f"Generating proposals for {len(patterns)} patterns...", file=sys.stderr)
 
-        proposals = []
+        # Classify which agent should receive each update
+        items = []
         for i, pattern in enumerate(patterns, 1):
-            print(f"  [{i}/{len(patterns)}] Processing: {pattern.get('name')}", file=sys.stderr)
-
-            # Classify which agent should receive this update
             agent = self.classify_pattern_agent(pattern)
-            print(f"    -> Agent: {agent}", file=sys.stderr)
+            print(
+                f"  [{i}/{len(patterns)}] Processing: {pattern.get('name')}\n"
+                f"    -> Agent: {agent}",
+                file=sys.stderr
+            )
+            items.append((pattern, agent))
+
+        # Send batch_size patterns per Claude call; calls are independent and
+        # I/O-bound, so run several at once. map keeps proposals in pattern order
+        size = 1 if self.mock else self.batch_size
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        if self.mock or self.concurrency == 1 or len(chunks) <= 1:
+            generated = [self._generate_chunk(chunk) for chunk in chunks]
+        else:
+            # Only concurrent runs need this; mock runs and --help skip the import
+            from concurrent.futures import ThreadPoolExecutor
 
-            # Generate proposal
-            proposal = self.generate_proposal(pattern, agent)
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+                generated = list(executor.map(self._generate_chunk, chunks))
+
+        proposals = []
+        for (pattern, agent), proposal in zip(
+            items, (proposal for chunk in generated for proposal in chunk)
+        ):
             proposal['agent'] = agent
             proposal['pattern_name'] = pattern.get('name')
             proposal['pattern_score'] = pattern.get('score')
-
             proposals.append(proposal)
 
         # Generate markdown output
-        markdown = self.format_proposal_markdown(patterns, proposals)
+        markdown = self.format_proposal_markdown(patterns, proposals, date=self._run_date)
 
         result = {
             'timestamp': datetime.now().isoformat(),
@@ -434,14 +830,19 @@ class ProposalGenerator:
         return result
 
 
-def main():
-    """Main entry point for CLI usage."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Generate agent prompt update proposals from pattern analysis.'
     )
     parser.add_argument(
         '--input',
-        help='Input JSON file from analyze.py (default: read from stdin)'
+        help='Input JSON file from analyze.py, or - for stdin (default: read from stdin)'
     )
     parser.add_argument(
         '--output',
@@ -452,15 +853,51 @@ def main():
         action='store_true',
         help='Use mock data instead of calling Claude API'
     )
-    parser.add_argument(
+    # Tri-state: --use-cli, --no-use-cli, or neither to auto-select
+    api_group = parser.add_mutually_exclusive_group()
+    api_group.add_argument(
+        '--use-cli',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Use Claude CLI; --no-use-cli uses the Anthropic Python SDK '
+             '(default: SDK if installed and an API key is set, else CLI)'
+    )
+    api_group.add_argument(
         '--use-sdk',
-        action='store_true',
-        help='Use Anthropic Python SDK instead of Claude CLI'
+        dest='use_cli',
+        action='store_false',
+        help='Same as --no-use-cli'
     )
     parser.add_argument(
         '--api-key',
         help='Anthropic API key (default: use ANTHROPIC_API_KEY env var)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=PROPOSAL_CONCURRENCY,
+        help=f'Claude calls to run in parallel (default: {PROPOSAL_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Generate one proposal at a time (same as --concurrency 1)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=PROPOSALS_PER_CALL,
+        help=f'Patterns to send per Claude call (default: {PROPOSALS_PER_CALL}; 1 = one call per pattern)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call Claude, ignoring proposals cached for identical patterns'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for cached proposals (default: ~/.cache/pattern-detector/proposals)'
+    )
     parser.add_argument(
         '--pretty',
         action='store_true',
@@ -472,21 +909,25 @@ def main():
         help='Output JSON instead of markdown'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Read input
-        if args.input:
-            with open(args.input, 'r') as f:
-                analysis = json.load(f)
+        if args.input and args.input != '-':
+            with open(args.input, 'rb') as f:
+                analysis = _loads(f.read())
         else:
-            analysis = json.load(sys.stdin)
+            analysis = _loads(_read_stdin())
 
         # Initialize generator
         generator = ProposalGenerator(
             api_key=args.api_key,
-            use_cli=not args.use_sdk,
-            mock=args.mock
+            use_cli=args.use_cli,
+            mock=args.mock,
+            concurrency=1 if args.sequential else args.concurrency,
+            batch_size=args.batch_size,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir
         )
 
         # Generate proposals
@@ -495,17 +936,9 @@ def main():
         # Determine output format and path
         if args.json:
             # Output JSON
-            if args.pretty:
-                output = json.dumps(results, indent=2)
-            else:
-                output = json.dumps(results)
-
+            _write_json(results, args.output, pretty=args.pretty)
             if args.output:
-                with open(args.output, 'w') as f:
-                    f.write(output)
                 print(f"\nJSON results written to {args.output}", file=sys.stderr)
-            else:
-                print(output)
         else:
             # Output markdown (default)
             output = results['markdown']
@@ -518,11 +951,11 @@ def main():
                 progress_dir = project_root / 'progress'
                 progress_dir.mkdir(exist_ok=True)
 
-                date_str = datetime.now().strftime('%Y-%m-%d')
-                output_path = progress_dir / f'pattern-proposals-{date_str}.md'
+                output_path = progress_dir / f'pattern-proposals-{generator._run_date}.md'
 
-            with open(output_path, 'w') as f:
-                f.write(output)
+            # One pre-encoded write instead of text-mode encoding in chunks
+            with open(output_path, 'wb') as f:
+                f.write(output.encode('utf-8'))
 
             print(f"\nProposals written to {output_path}", file=sys.stderr)
 
@@ -5,10 +5,69 @@ Acceptance tests for Pattern Hunter CLI
 Tests the CLI interface and workflow orchestration.
 """
 
+import contextlib
+import io
+import json
 import subprocess
 import sys
+import tempfile
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+# Command prefix shared by every run_cli call
+_CLI_BASE = [sys.executable, str(SCRIPT_DIR / 'cli.py')]
+
+# Patterns fed to stages in the in-process tests
+SAMPLE_PATTERNS = {
+    'patterns': [
+        {
+            'name': 'Silent Fallback Pattern',
+            'description': 'Using .get() with defaults hides missing data',
+            'evidence': ['app/config.py'],
+            'frequency': 'weekly',
+            'impact': 'high',
+            'root_cause': 'Convenience over validation',
+            'score': 8.5
+        },
+        {
+            'name': 'Missing Error Context',
+            'description': 'Exceptions raised without saying what failed',
+            'evidence': ['app/loader.py'],
+            'frequency': 'daily',
+            'impact': 'medium',
+            'root_cause': 'Errors written in a hurry',
+            'score': 6.0
+        }
+    ]
+}
+
+
+def run_stage_in_process(name, argv, input_data=None):
+    """
+    Run a stage through the CLI's in-process runner (no dry-run, no --isolate).
+
+    Args:
+        name: Stage script name without .py
+        argv: Arguments for the stage
+        input_data: Optional stdin text for the stage
+
+    Returns:
+        Tuple of (returncode, console output)
+    """
+    import cli
+
+    with tempfile.TemporaryDirectory() as repo:
+        hunter = cli.PatternHunterCLI(repo_path=Path(repo))
+        console = io.StringIO()
+        with contextlib.redirect_stdout(console), contextlib.redirect_stderr(console):
+            returncode = hunter._run_stage(name, argv, f"{name} failed", input_data=input_data)
+
+    return returncode, console.getvalue()
+
 
 def run_cli(*args, input_data=None):
     """
@@ -21,8 +80,7 @@ def run_cli(*args, input_data=None):
     Returns:
         Tuple of (returncode, stdout, stderr)
     """
-    script = Path(__file__).parent / 'cli.py'
-    cmd = [sys.executable, str(script)] + list(args)
+    cmd = _CLI_BASE + list(args)
 
     result = subprocess.run(
         cmd,
@@ -120,6 +178,174 @@ def test_invalid_command():
     print("✓ Invalid command test passed")
 
 
+def test_propose_updates_in_process():
+    """Test that propose_updates runs in-process with patterns on stdin."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / 'proposals.md'
+        returncode, console = run_stage_in_process(
+            'propose_updates',
+            ['--input', '-', '--mock', '--output', str(output)],
+            input_data=json.dumps(SAMPLE_PATTERNS)
+        )
+
+        assert returncode == 0, f"In-process propose_updates failed: {console}"
+        assert 'Silent Fallback Pattern' in output.read_text(), "Proposal missing from output"
+
+    # JSON to stdout goes through sys.stdout.buffer
+    returncode, console = run_stage_in_process(
+        'propose_updates',
+        ['--input', '-', '--mock', '--json'],
+        input_data=json.dumps(SAMPLE_PATTERNS)
+    )
+
+    assert returncode == 0, f"In-process propose_updates --json failed: {console}"
+    assert '"total_proposals":2' in console, "JSON output not shown"
+
+    print("✓ In-process propose_updates test passed")
+
+
+def test_generate_tests_in_process():
+    """Test that generate_tests runs in-process with patterns on stdin."""
+    with tempfile.TemporaryDirectory() as tmp:
+        returncode, console = run_stage_in_process(
+            'generate_tests',
+            ['--input', '-', '--mock', '--output-dir', tmp],
+            input_data=json.dumps(SAMPLE_PATTERNS)
+        )
+
+        assert returncode == 0, f"In-process generate_tests failed: {console}"
+        assert (Path(tmp) / 'test_silent_fallback_pattern.py').exists(), "Test file not written"
+
+    print("✓ In-process generate_tests test passed")
+
+
+def test_split_batch_response():
+    """Test that batch responses with missing or extra blocks are handled."""
+    import generate_tests
+
+    generator = generate_tests.TestGenerator(use_cache=False)
+    response = (
+        "=== BEGIN test_silent_fallback_pattern.py ===\n"
+        "def test_one():\n    assert True\n"
+        "=== END ===\n"
+        "=== BEGIN test_unrequested.py ===\n"
+        "def test_two():\n    assert True\n"
+        "=== END ===\n"
+    )
+
+    blocks = generator._split_batch_response(response)
+    assert set(blocks) == {'test_silent_fallback_pattern.py', 'test_unrequested.py'}, \
+        f"Unexpected blocks: {sorted(blocks)}"
+
+    # The missing pattern falls back to its mock template; the extra block is dropped
+    generator._call_claude = lambda request, patterns=1: response
+    with contextlib.redirect_stderr(io.StringIO()):
+        results = generator.generate_batch(SAMPLE_PATTERNS['patterns'])
+
+    assert [r['filename'] for r in results] == [
+        'test_silent_fallback_pattern.py', 'test_missing_error_context.py'
+    ], "Results not in pattern order"
+    assert 'def test_one' in results[0]['test_code'], "Returned block not used"
+    assert results[0]['pattern_hash'], "Generated test should carry a pattern hash"
+    assert results[1]['pattern_hash'] is None, "Mock fallback should not carry a pattern hash"
+
+    print("✓ Batch response split test passed")
+
+
+def test_pattern_hash_skip():
+    """Test that unchanged patterns are skipped and edited ones regenerated."""
+    import generate_tests
+
+    pattern = SAMPLE_PATTERNS['patterns'][0]
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stderr(io.StringIO()):
+        generator = generate_tests.TestGenerator(mock=True, output_dir=tmp)
+        written = generator.write_test_files(generator.generate_all_tests([pattern]), Path(tmp))
+        assert len(written) == 1, "Test file not written"
+
+        results = generate_tests.TestGenerator(mock=True, output_dir=tmp).generate_all_tests([pattern])
+        assert results[0].get('skipped'), "Unchanged pattern was regenerated"
+
+        edited = dict(pattern, description='Defaults mask missing configuration')
+        results = generate_tests.TestGenerator(mock=True, output_dir=tmp).generate_all_tests([edited])
+        assert not results[0].get('skipped'), "Edited pattern was skipped"
+        assert results[0]['test_code'], "Edited pattern has no test code"
+
+    print("✓ Pattern hash skip test passed")
+
+
+def test_proposals_batch_fallback():
+    """Test that a batch reply of the wrong length falls back to one call per pattern."""
+    import propose_updates
+
+    generator = propose_updates.ProposalGenerator(use_cli=True, use_cache=False)
+    patterns = SAMPLE_PATTERNS['patterns']
+    calls = []
+
+    def fake_call(prompt, count=1):
+        calls.append(count)
+        proposal = {
+            'non_negotiable': '- [ ] ALWAYS check',
+            'discipline': 'Check first',
+            'memory_tags': ['anti-patterns']
+        }
+        if count > 1:
+            return json.dumps([dict(proposal, memory='Learned: batch')])  # One short
+        name = next(p['name'] for p in patterns if p['name'] in prompt)
+        return json.dumps(dict(proposal, memory=f"Learned: {name}"))
+
+    generator._call_claude = fake_call
+    with contextlib.redirect_stderr(io.StringIO()):
+        proposals = generator.generate_proposals_batch([(p, 'Dev') for p in patterns])
+
+    assert calls == [2, 1, 1], f"Unexpected Claude calls: {calls}"
+    assert [p['memory'] for p in proposals] == [
+        f"Learned: {p['name']}" for p in patterns
+    ], "Fallback proposals missing or out of order"
+
+    print("✓ Proposal batch fallback test passed")
+
+
+def test_analyze_cli_retry():
+    """Test that CLI rate-limit/overload failures are retried and others are not."""
+    import analyze
+
+    def failing_run(stderr, calls):
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            raise subprocess.CalledProcessError(1, cmd, stderr=stderr)
+        return run
+
+    analyzer = analyze.PatternAnalyzer(use_cli=True, use_cache=False)
+    analyzer.retry_delay = 0
+    real_subprocess = analyze.subprocess
+    try:
+        for stderr, expected_calls in [
+            ('API Error: 529 {"type":"error","error":{"type":"overloaded_error"}}', analyzer.max_retries),
+            ('API Error: Rate limit reached', analyzer.max_retries),
+            ('Invalid API key · Please run /login', 1),
+        ]:
+            calls = []
+            analyze.subprocess = types.SimpleNamespace(
+                run=failing_run(stderr, calls),
+                TimeoutExpired=subprocess.TimeoutExpired,
+                CalledProcessError=subprocess.CalledProcessError
+            )
+            try:
+                with contextlib.redirect_stderr(io.StringIO()):
+                    analyzer._call_claude_with_retry('{}', analyzer.analysis_model)
+            except Exception:
+                pass
+            else:
+                raise AssertionError(f"CLI failure was not raised: {stderr}")
+
+            assert len(calls) == expected_calls, \
+                f"Expected {expected_calls} call(s) for {stderr!r}, got {len(calls)}"
+    finally:
+        analyze.subprocess = real_subprocess
+
+    print("✓ Analyze CLI retry test passed")
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -135,11 +361,21 @@ def main():
         test_invalid_command,
     ]
 
+    # In-process tests swap sys.stdin/sys.stdout, so they run one at a time
+    serial_tests = [
+        test_propose_updates_in_process,
+        test_generate_tests_in_process,
+        test_split_batch_response,
+        test_pattern_hash_skip,
+        test_proposals_batch_fallback,
+        test_analyze_cli_retry,
+    ]
+
     failed = []
 
-    for test in tests:
+    def record(test, run):
         try:
-            test()
+            run()
         except AssertionError as e:
             print(f"✗ {test.__name__} failed: {e}")
             failed.append(test.__name__)
@@ -147,6 +383,16 @@ def main():
             print(f"✗ {test.__name__} error: {e}")
             failed.append(test.__name__)
 
+    # Each test waits on its own CLI subprocess, so run them side by side;
+    # results are reported as they finish
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test): test for test in tests}
+        for future in as_completed(futures):
+            record(futures[future], future.result)
+
+    for test in serial_tests:
+        record(test, test)
+
     print("\n" + "=" * 60)
     if failed:
         print(f"FAILED: {len(failed)} test(s) failed")
@@ -154,7 +400,7 @@ def main():
             print(f"  - {name}")
         return 1
     else:
-        print(f"SUCCESS: All {len(tests)} tests passed")
+        print(f"SUCCESS: All {len(tests) + len(serial_tests)} tests passed")
     print("=" * 60 + "\n")
 
     return 0
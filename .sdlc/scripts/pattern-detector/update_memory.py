@@ -377,8 +377,13 @@ class MemoryUpdater:
                     print(f"  - {error}", file=sys.stderr)
 
 
-def main():
-    """Main entry point for CLI usage."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Add pattern learnings to agent memory.'
     )
@@ -411,7 +416,7 @@ def main():
         help='Pretty-print JSON output'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Read input
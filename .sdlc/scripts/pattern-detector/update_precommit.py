@@ -419,8 +419,13 @@ class PreCommitUpdater:
             return False, False
 
 
-def main():
-    """Main entry point for CLI usage."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for CLI usage.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description='Update .pre-commit-config.yaml with pattern defeat tests.'
     )
@@ -450,7 +455,7 @@ def main():
         help='Only check if update is needed, do not modify anything'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Initialize updater
     updater = PreCommitUpdater(